@@ -14,10 +14,109 @@ Design Principles:
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Tuple, Any
 from PIL import Image, ImageDraw, ImageFont
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import os
+import re
+import weakref
+import numpy as np
 from src.utils.color_utils import get_contrasting_color, calculate_contrast_ratio
 from src.utils.font_manager import get_font_manager
 
+# Try to import numba for JIT-compiled pixel kernels
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True)
+    def _composite_kernel(bg, fg):
+        """
+        Blend an (h, w, 4) uint8 RGBA overlay into an (h, w, 3) uint8 RGB array in place.
+
+        Single fused pass with no temporaries; the integer rounding matches the
+        NumPy path in LayoutEngine._composite_over exactly.
+        """
+        h, w = fg.shape[0], fg.shape[1]
+        for i in prange(h):
+            for j in range(w):
+                a = np.uint32(fg[i, j, 3])
+                if a == 0:
+                    continue
+                inv = np.uint32(255) - a
+                for c in range(3):
+                    v = np.uint32(fg[i, j, c]) * a + np.uint32(bg[i, j, c]) * inv + np.uint32(128)
+                    bg[i, j, c] = (v + (v >> np.uint32(8))) >> np.uint32(8)
+
+
+# Arabic/Farsi script ranges used for RTL detection
+_RTL_PATTERN = re.compile(r'[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDFF\uFE70-\uFEFF]')
+
+
+@lru_cache(maxsize=1024)
+def _contains_rtl(text: str) -> bool:
+    """Memoized RTL scan; layouts check the same strings several times per render."""
+    return _RTL_PATTERN.search(text) is not None
+
+
+@lru_cache(maxsize=512)
+def _reshape_for_display(text: str) -> str:
+    """
+    Reshape Arabic/Farsi text and reorder it for display, memoized per string.
+
+    Reshaping and the bidi pass both walk the whole string; titles, names and
+    bullets are shaped again on every render of the same copy otherwise.
+    """
+    try:
+        import arabic_reshaper
+        from bidi.algorithm import get_display
+
+        reshaped_text = arabic_reshaper.reshape(text)
+        return get_display(reshaped_text)
+    except Exception:
+        return text
+
+
+@lru_cache(maxsize=8)
+def _linear_gradient(width: int, height: int, color1: Tuple[int, int, int],
+                     color2: Tuple[int, int, int], vertical: bool) -> Image.Image:
+    """
+    Render a two-color linear gradient, memoized per size, colors and direction.
+
+    The returned image is shared and must not be modified.
+    """
+    # A linear gradient only varies along one axis: compute that single line
+    # of colors, then let Pillow stretch the 1-pixel strip over the canvas
+    # with a NEAREST resize (a pure copy, so the result is exact). This beats
+    # a Numba fill of the full array: the kernel itself is about as fast, but
+    # wrapping its output with Image.fromarray costs as much again
+    steps = height if vertical else width
+    c1 = np.array(color1, dtype=np.float64)
+    c2 = np.array(color2, dtype=np.float64)
+
+    ratio = (np.arange(steps) / steps)[:, None]
+    line = (c1 * (1 - ratio) + c2 * ratio).astype(np.uint8)
+    strip = line[:, None, :] if vertical else line[None, :, :]
+
+    return Image.fromarray(np.ascontiguousarray(strip), 'RGB').resize(
+        (width, height), Image.Resampling.NEAREST
+    )
+
+
+# Per-font character advance widths, filled lazily by _font_advance_table
+_ADVANCE_TABLES: "weakref.WeakKeyDictionary[ImageFont.ImageFont, Dict[str, float]]" = weakref.WeakKeyDictionary()
+
+# Per-font line pitch (ascent + descent), filled lazily by _get_line_height
+_LINE_HEIGHTS: "weakref.WeakKeyDictionary[ImageFont.ImageFont, int]" = weakref.WeakKeyDictionary()
+
+# Wrapped and shaped lines keyed by (text, font file, font size, max width, rtl),
+# filled by _shape_and_wrap; cleared wholesale once it reaches the size limit
+_SHAPED_LINES: Dict[Tuple[str, str, float, int, bool], Tuple[str, ...]] = {}
+_SHAPED_LINES_LIMIT = 512
+
 
 class LayoutEngine(ABC):
     """
@@ -168,7 +267,8 @@ class LayoutEngine(ABC):
         - image: Custom background image
         
         Returns:
-            PIL Image object with background
+            PIL Image object with background, always 8-bit RGB so layouts
+            can paste and draw into it without a mode conversion
         """
         bg_mode = self.background.get('mode', 'gradient')
         
@@ -208,25 +308,33 @@ class LayoutEngine(ABC):
         else:
             color2 = (255, 255, 255)
         
-        img = Image.new('RGB', (self.canvas_width, self.canvas_height))
-        draw = ImageDraw.Draw(img)
-        
-        if direction == 'vertical':
-            for y in range(self.canvas_height):
-                ratio = y / self.canvas_height
-                r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-                g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-                b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-                draw.line([(0, y), (self.canvas_width, y)], fill=(r, g, b))
-        else:  # horizontal
-            for x in range(self.canvas_width):
-                ratio = x / self.canvas_width
-                r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-                g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-                b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-                draw.line([(x, 0), (x, self.canvas_height)], fill=(r, g, b))
-        
-        return img
+        return self._render_linear_gradient(color1, color2, direction)
+
+    def _render_linear_gradient(self, color1: Tuple[int, ...], color2: Tuple[int, ...],
+                                direction: str = 'vertical') -> Image.Image:
+        """
+        Render a two-color linear gradient over the whole canvas.
+
+        Args:
+            color1: Start RGB color
+            color2: End RGB color
+            direction: 'vertical' (top to bottom) or 'horizontal' (left to right)
+
+        Returns:
+            New RGB image of the canvas size
+        """
+        color1 = tuple(color1[:3])
+        color2 = tuple(color2[:3])
+
+        # Identical stops are just a solid fill
+        if color1 == color2:
+            return Image.new('RGB', (self.canvas_width, self.canvas_height), color1)
+
+        # Carousel slides usually share one gradient; the cached image is never
+        # drawn on directly, each caller gets its own copy
+        gradient = _linear_gradient(self.canvas_width, self.canvas_height,
+                                    color1, color2, direction == 'vertical')
+        return gradient.copy()
 
     def _create_image_background(self) -> Image.Image:
         """
@@ -288,6 +396,10 @@ class LayoutEngine(ABC):
                 print(f"✅ Pattern composited over gradient at {pattern_opacity*100:.1f}% opacity")
                 return base
             else:
+                # The fitted image is already a private copy; only convert
+                # when it is not RGB yet
+                if fitted_image.mode == 'RGB':
+                    return fitted_image
                 return fitted_image.convert('RGB')
         
         except Exception as e:
@@ -364,9 +476,7 @@ class LayoutEngine(ABC):
         Returns:
             True if text contains RTL characters
         """
-        import re
-        arabic_pattern = r'[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDFF\uFE70-\uFEFF]'
-        return bool(re.search(arabic_pattern, text))
+        return _contains_rtl(text)
 
     def _prepare_arabic_text(self, text: str) -> str:
         """
@@ -378,14 +488,7 @@ class LayoutEngine(ABC):
         Returns:
             Reshaped text ready for rendering
         """
-        try:
-            import arabic_reshaper
-            from bidi.algorithm import get_display
-
-            reshaped_text = arabic_reshaper.reshape(text)
-            return get_display(reshaped_text)
-        except Exception:
-            return text
+        return _reshape_for_display(text)
 
     def _wrap_text(self, text: str, font: ImageFont.ImageFont, max_width: int) -> List[str]:
         """
@@ -422,6 +525,262 @@ class LayoutEngine(ABC):
 
         return lines
 
+    def _font_advance_table(self, font: ImageFont.ImageFont, text: str) -> Optional[Dict[str, float]]:
+        """
+        Get per-character advance widths for a font, covering every char in text.
+
+        Tables are kept per font object and only grow by the characters not
+        measured before, so repeated renders pay one getlength call per new glyph.
+
+        Args:
+            font: Font to measure with
+            text: Text whose characters must be present in the table
+
+        Returns:
+            Dict mapping character to advance width, or None if the font
+            cannot measure single characters
+        """
+        if not hasattr(font, 'getlength'):
+            return None
+
+        table = _ADVANCE_TABLES.get(font)
+        if table is None:
+            table = {}
+            _ADVANCE_TABLES[font] = table
+
+        for char in set(text).difference(table):
+            table[char] = font.getlength(char)
+
+        return table
+
+    def _shape_and_wrap(self, text: str, font: ImageFont.ImageFont, max_width: int,
+                        is_rtl: bool) -> List[str]:
+        """
+        Wrap text to max_width and reshape each line for display if RTL.
+
+        Lines are wrapped in logical order and shaped afterwards, so multi-line
+        RTL text keeps its reading order. Results are memoized per font file and
+        size, so batch and carousel renders of the same copy skip both the wrap
+        and the reshaping.
+
+        Args:
+            text: Text to wrap
+            font: Font to use for measurement
+            max_width: Maximum line width in pixels
+            is_rtl: Whether to reshape lines for Arabic/Farsi display
+
+        Returns:
+            List of display-ready text lines
+        """
+        font_path = getattr(font, 'path', None)
+        key = None
+        if isinstance(font_path, str):
+            key = (text, font_path, font.size, max_width, is_rtl)
+            cached = _SHAPED_LINES.get(key)
+            if cached is not None:
+                return list(cached)
+
+        lines = self._wrap_text_fast(text, font, max_width)
+        if is_rtl:
+            lines = [self._prepare_arabic_text(line) for line in lines]
+
+        if key is not None:
+            if len(_SHAPED_LINES) >= _SHAPED_LINES_LIMIT:
+                _SHAPED_LINES.clear()
+            _SHAPED_LINES[key] = tuple(lines)
+
+        return lines
+
+    def _get_line_height(self, font: ImageFont.ImageFont) -> int:
+        """
+        Get the line pitch of a font (ascent + descent).
+
+        Unlike a per-line bbox height this is constant for the font, so it is
+        measured once per font object and every line advances by the same amount.
+        """
+        height = _LINE_HEIGHTS.get(font)
+        if height is None:
+            if hasattr(font, 'getmetrics'):
+                ascent, descent = font.getmetrics()
+                height = ascent + descent
+            else:
+                bbox = font.getbbox('Ay')
+                height = bbox[3] - bbox[1]
+            _LINE_HEIGHTS[font] = height
+
+        return height
+
+    def _wrap_text_fast(self, text: str, font: ImageFont.ImageFont, max_width: int) -> List[str]:
+        """
+        Wrap text like _wrap_text, using cached char widths to find break points.
+
+        Cumulative character advances give each line's break point with a
+        binary search; the candidate is then confirmed with real bbox
+        measurements so the result matches _wrap_text (kerning makes the
+        advance sum an estimate only). This needs about two getbbox calls per
+        line instead of one per word.
+
+        Args:
+            text: Text to wrap
+            font: Font to use for measurement
+            max_width: Maximum line width in pixels
+
+        Returns:
+            List of text lines
+        """
+        words = text.split()
+        if not words:
+            return []
+
+        joined = ' '.join(words)
+        table = self._font_advance_table(font, joined)
+        if table is None:
+            return self._wrap_text(text, font, max_width)
+
+        widths = np.fromiter((table[c] for c in joined), dtype=np.float64, count=len(joined))
+        cumulative = np.concatenate(([0.0], np.cumsum(widths)))
+
+        # Character offsets of each word within the joined string
+        word_starts = []
+        word_ends = []
+        offset = 0
+        for word in words:
+            word_starts.append(offset)
+            offset += len(word)
+            word_ends.append(offset)
+            offset += 1  # Joining space
+        end_widths = cumulative[word_ends]
+
+        def fits(first: int, last: int) -> bool:
+            bbox = font.getbbox(' '.join(words[first:last + 1]))
+            return bbox[2] - bbox[0] <= max_width
+
+        lines = []
+        first = 0
+        while first < len(words):
+            limit = cumulative[word_starts[first]] + max_width
+            last = max(first, int(np.searchsorted(end_widths, limit, side='right')) - 1)
+
+            while last > first and not fits(first, last):
+                last -= 1
+            while last + 1 < len(words) and fits(first, last + 1):
+                last += 1
+
+            lines.append(' '.join(words[first:last + 1]))
+            first = last + 1
+
+        return lines
+
+    def _get_text_bbox(self, font: ImageFont.ImageFont, text: str,
+                       cache: Optional[Dict] = None) -> Tuple[int, int, int, int]:
+        """
+        Measure text bounding box, reusing a per-render cache when given.
+
+        Args:
+            font: Font to measure with
+            text: Text to measure
+            cache: Optional dict keyed by (id(font), text); only valid while
+                   the fonts it was filled with are alive (i.e. one render)
+
+        Returns:
+            Bounding box tuple (left, top, right, bottom)
+        """
+        if cache is None:
+            return font.getbbox(text)
+
+        key = (id(font), text)
+        bbox = cache.get(key)
+        if bbox is None:
+            bbox = font.getbbox(text)
+            cache[key] = bbox
+        return bbox
+
+    def _blend_color_overlay(self, img: Image.Image, color: Tuple[int, int, int],
+                             opacity: float) -> Image.Image:
+        """
+        Blend a solid color over the whole image in one integer NumPy pass.
+
+        Equivalent to alpha-compositing a full-canvas (color, opacity) layer,
+        without allocating the layer or converting the image to RGBA. A black
+        overlay only darkens, so it takes a lookup-table shortcut.
+
+        Args:
+            img: Source image
+            color: RGB overlay color
+            opacity: Overlay opacity (0.0-1.0)
+
+        Returns:
+            New RGB image with the overlay applied
+        """
+        alpha = int(opacity * 255)
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+
+        if tuple(color[:3]) == (0, 0, 0):
+            # Black overlay (the default) is a pure per-value scale: run it as
+            # a 256-entry lookup table in Pillow, no array round-trip needed
+            scaled = [v * (255 - alpha) + 128 for v in range(256)]
+            lut = [(x + (x >> 8)) >> 8 for x in scaled]
+            return img.point(lut * 3)
+
+        arr = np.asarray(img, dtype=np.uint16)
+        overlay = np.array(color[:3], dtype=np.uint16) * alpha
+
+        # x / 255 rounded, via (x + 128 + ((x + 128) >> 8)) >> 8
+        blended = arr * (255 - alpha) + overlay + 128
+        blended = (blended + (blended >> 8)) >> 8
+
+        return Image.fromarray(blended.astype(np.uint8), 'RGB')
+
+    def _composite_over(self, canvas: Image.Image, overlay: Image.Image, xy: Tuple[int, int]):
+        """
+        Alpha-composite an RGBA overlay onto an RGB or RGBA canvas in place.
+
+        Only the region the overlay covers is read and written back. RGB
+        canvases are blended with integer math (a fused numba kernel, or uint16
+        NumPy without it); RGBA canvases use Pillow's Porter-Duff
+        alpha_composite limited to the same region, so canvas alpha is merged
+        rather than overwritten.
+
+        Args:
+            canvas: RGB or RGBA image to draw on (modified in place)
+            overlay: RGBA image to composite
+            xy: Top-left position of the overlay on the canvas
+        """
+        if canvas.mode not in ('RGB', 'RGBA') or overlay.mode != 'RGBA':
+            canvas.paste(overlay, xy, overlay if overlay.mode == 'RGBA' else None)
+            return
+
+        x, y = xy
+        left, top = max(x, 0), max(y, 0)
+        right = min(x + overlay.width, canvas.width)
+        bottom = min(y + overlay.height, canvas.height)
+        if right <= left or bottom <= top:
+            return
+
+        if canvas.mode == 'RGBA':
+            canvas.alpha_composite(overlay, dest=(left, top),
+                                   source=(left - x, top - y, right - x, bottom - y))
+            return
+
+        fg = np.asarray(overlay)[top - y:bottom - y, left - x:right - x]
+
+        if NUMBA_AVAILABLE:
+            bg = np.array(canvas.crop((left, top, right, bottom)))
+            _composite_kernel(bg, np.ascontiguousarray(fg))
+            canvas.paste(Image.fromarray(bg, 'RGB'), (left, top))
+            return
+
+        fg = fg.astype(np.uint16)
+        bg = np.asarray(canvas.crop((left, top, right, bottom)), dtype=np.uint16)
+        alpha = fg[..., 3:4]
+
+        # x / 255 rounded, via (x + 128 + ((x + 128) >> 8)) >> 8
+        blended = fg[..., :3] * alpha + bg * (255 - alpha) + 128
+        blended = (blended + (blended >> 8)) >> 8
+
+        canvas.paste(Image.fromarray(blended.astype(np.uint8), 'RGB'), (left, top))
+
     def _get_adaptive_text_color(self, bg_color: Tuple[int, int, int],
                                  prefer_dark: bool = False) -> Tuple[int, int, int]:
         """
@@ -700,6 +1059,41 @@ class CarouselLayoutEngine(LayoutEngine):
     LAYOUT_CATEGORY = "carousel_multi_slide"
     SUPPORTS_CAROUSEL = True
 
+    @classmethod
+    def render_carousel(cls, slides_config: List[Dict[str, Any]]) -> List[Image.Image]:
+        """
+        Render every slide of a carousel concurrently.
+
+        Slides are independent, and their cost is dominated by image fetches
+        and Pillow C operations that release the GIL, so a thread pool gives a
+        near-linear speedup for typical 5-10 slide carousels.
+
+        Args:
+            slides_config: One dict per slide with optional 'content',
+                'assets', 'background' and 'options' keys (the constructor
+                arguments)
+
+        Returns:
+            Rendered slide images, in the order of slides_config
+        """
+        if not slides_config:
+            return []
+
+        def render_slide(slide: Dict[str, Any]) -> List[Image.Image]:
+            layout = cls(
+                slide.get('content', {}),
+                slide.get('assets', {}),
+                slide.get('background', {}),
+                slide.get('options', {})
+            )
+            return layout.render()
+
+        max_workers = min(len(slides_config), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            rendered = list(executor.map(render_slide, slides_config))
+
+        return [image for images in rendered for image in images]
+
     def _add_slide_number(self, image: Image.Image,
                          slide_num: int,
                          total_slides: int,
@@ -13,9 +13,56 @@ Perfect for: Sales, announcements, launches, promotions
 from .base import PhotoLayoutEngine, register_layout
 from PIL import Image, ImageDraw, ImageFont
 from typing import List, Tuple, Optional
+from functools import lru_cache
 import os
 
 
+@lru_cache(maxsize=128)
+def _render_cta_sprite(display_text: str, font: ImageFont.ImageFont,
+                       bg_color: Tuple[int, int, int], text_color: Tuple[int, int, int],
+                       is_rtl: bool) -> Image.Image:
+    """
+    Render a CTA button (rounded rectangle + label) into a tight RGBA sprite.
+
+    Campaigns render the same CTA across many variants, so the finished
+    button is cached and pasted instead of being drawn again each time.
+    Fonts come from the shared font cache, so the font object is a stable key.
+    The returned sprite is shared and must not be modified.
+    """
+    # Measure text
+    bbox = font.getbbox(display_text)
+    text_width = bbox[2] - bbox[0]
+    text_height = bbox[3] - bbox[1]
+
+    # Button dimensions
+    padding_x = 40
+    padding_y = 20
+    button_width = text_width + (padding_x * 2)
+    button_height = text_height + (padding_y * 2)
+    border_radius = 12
+
+    # rounded_rectangle includes its end coordinates, hence the extra pixel
+    sprite = Image.new('RGBA', (button_width + 1, button_height + 1), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(sprite)
+    draw.rounded_rectangle(
+        [(0, 0), (button_width, button_height)],
+        radius=border_radius,
+        fill=bg_color
+    )
+
+    # Draw text with proper RTL alignment
+    if is_rtl:
+        # For RTL text, align right within button
+        text_x = button_width - padding_x - text_width
+    else:
+        # For LTR text, align left within button
+        text_x = padding_x
+
+    draw.text((text_x, padding_y), display_text, font=font, fill=text_color)
+
+    return sprite
+
+
 @register_layout
 class HeadlinePromoLayout(PhotoLayoutEngine):
     """
@@ -165,13 +212,13 @@ class HeadlinePromoLayout(PhotoLayoutEngine):
                 )
                 print(f"   Hero fitted to canvas: {hero_fitted.size}")
 
-                # Create overlay for text contrast
-                overlay = Image.new('RGBA', (self.canvas_width, self.canvas_height),
-                                   (0, 0, 0, 128))  # 50% black overlay
-
-                # Composite
+                # Blend a 50% black overlay for text contrast straight into
+                # the canvas instead of compositing a full-size RGBA layer
                 canvas = hero_fitted.convert('RGB')
-                canvas.paste(overlay, (0, 0), overlay)
+                ImageDraw.Draw(canvas, 'RGBA').rectangle(
+                    [(0, 0), (self.canvas_width - 1, self.canvas_height - 1)],
+                    fill=(0, 0, 0, 128)
+                )
                 print(f"✅ Hero image applied as background with overlay")
 
             elif layout_mode == 'side':
@@ -208,13 +255,8 @@ class HeadlinePromoLayout(PhotoLayoutEngine):
                     shadow_x = x_pos + 10
                     shadow_y = y_pos + 10
                     
-                    # Create composite image for proper shadow rendering
-                    shadow_canvas = Image.new('RGBA', (self.canvas_width, self.canvas_height), (0, 0, 0, 0))
-                    shadow_canvas.paste(shadow, (shadow_x, shadow_y), shadow)
-                    shadow_canvas = shadow_canvas.convert('RGB')
-                    
-                    # Composite shadow on main canvas
-                    canvas = Image.alpha_composite(canvas.convert('RGBA'), shadow_canvas.convert('RGBA')).convert('RGB')
+                    # Composite shadow on main canvas, limited to its own region
+                    canvas.paste(shadow, (shadow_x, shadow_y), shadow)
                     print(f"✅ Product shadow applied")
                 
                 # Paste product on top
@@ -248,9 +290,10 @@ class HeadlinePromoLayout(PhotoLayoutEngine):
         # Add text contrast overlay if enabled
         if self.options.get('text_overlay', True):
             overlay_height = int(self.canvas_height * 0.4)  # Top 40%
-            overlay = Image.new('RGBA', (self.canvas_width, overlay_height), 
-                               (0, 0, 0, int(255 * 0.3)))  # 30% black
-            img.paste(overlay, (0, 0), overlay)
+            ImageDraw.Draw(img, 'RGBA').rectangle(
+                [(0, 0), (self.canvas_width - 1, overlay_height - 1)],
+                fill=(0, 0, 0, int(255 * 0.3))  # 30% black
+            )
             print(f"✅ Text contrast overlay applied")
 
         # Get content
@@ -279,7 +322,7 @@ class HeadlinePromoLayout(PhotoLayoutEngine):
             text_x_start = self.canvas_width // 2
 
         # Calculate vertical centering
-        total_height = self._calculate_total_text_height(
+        total_height, headline_lines, subheadline_lines = self._calculate_total_text_height(
             headline, subheadline, cta,
             headline_font, subheadline_font, cta_font,
             max_text_width, is_rtl
@@ -298,7 +341,8 @@ class HeadlinePromoLayout(PhotoLayoutEngine):
         current_y = self._draw_headline(
             img, headline, headline_font,
             text_x_start, current_y,
-            max_text_width, tuple(headline_color), is_rtl
+            max_text_width, tuple(headline_color), is_rtl,
+            lines=headline_lines
         )
 
         # Draw subheadline
@@ -308,7 +352,8 @@ class HeadlinePromoLayout(PhotoLayoutEngine):
             current_y = self._draw_subheadline(
                 img, subheadline, subheadline_font,
                 text_x_start, current_y,
-                max_text_width, tuple(subheadline_color), is_rtl
+                max_text_width, tuple(subheadline_color), is_rtl,
+                lines=subheadline_lines
             )
 
         # Draw CTA button
@@ -352,101 +397,123 @@ class HeadlinePromoLayout(PhotoLayoutEngine):
                                     headline_font: ImageFont.ImageFont,
                                     subheadline_font: Optional[ImageFont.ImageFont],
                                     cta_font: Optional[ImageFont.ImageFont],
-                                    max_width: int, is_rtl: bool) -> int:
-        """Calculate total height of all text elements."""
+                                    max_width: int, is_rtl: bool) -> Tuple[int, List[str], List[str]]:
+        """
+        Calculate total height of all text elements.
+
+        Returns:
+            Tuple of (total height, wrapped headline lines, wrapped subheadline
+            lines); RTL lines are already reshaped so the draw helpers can
+            reuse them instead of wrapping and shaping a second time.
+        """
         total = 0
+        subheadline_lines = []
 
         # Headline
-        headline_lines = self._wrap_text(headline, headline_font, max_width)
-        if is_rtl:
-            headline_lines = [self._prepare_arabic_text(line) for line in headline_lines]
+        headline_lines = self._shape_and_wrap(headline, headline_font, max_width, is_rtl)
 
-        for line in headline_lines:
-            bbox = headline_font.getbbox(line)
-            total += (bbox[3] - bbox[1]) + 15  # Line height + spacing
+        total += (self._get_line_height(headline_font) + 15) * len(headline_lines)  # Line height + spacing
 
         # Subheadline
         if subheadline and subheadline_font:
             total += 30  # Spacing before subheadline
-            subheadline_lines = self._wrap_text(subheadline, subheadline_font, max_width)
-            if is_rtl and self._is_rtl_text(subheadline):
-                subheadline_lines = [self._prepare_arabic_text(line) for line in subheadline_lines]
+            subheadline_lines = self._shape_and_wrap(
+                subheadline, subheadline_font, max_width,
+                is_rtl and self._is_rtl_text(subheadline)
+            )
 
-            for line in subheadline_lines:
-                bbox = subheadline_font.getbbox(line)
-                total += (bbox[3] - bbox[1]) + 10
+            total += (self._get_line_height(subheadline_font) + 10) * len(subheadline_lines)
 
         # CTA
         if cta and cta_font:
             total += 50  # Spacing before CTA
             total += 60  # CTA button height
 
-        return total
+        return total, headline_lines, subheadline_lines
 
     def _draw_headline(self, img: Image.Image, text: str, font: ImageFont.ImageFont,
                       x: int, y: int, max_width: int, color: Tuple[int, int, int],
-                      is_rtl: bool) -> int:
-        """Draw headline text. Returns new Y position."""
+                      is_rtl: bool,
+                      lines: Optional[List[str]] = None) -> int:
+        """Draw headline text (or pre-wrapped, pre-shaped lines). Returns new Y position."""
+        if lines is None:
+            lines = self._shape_and_wrap(text, font, max_width, is_rtl)
+
+        if not lines:
+            return y
+
+        # One multiline block per headline: Pillow advances lines by
+        # getbbox('A')[3] + spacing, so pick spacing to keep the font line pitch
+        line_pitch = self._get_line_height(font) + 15
+        spacing = line_pitch - font.getbbox('A')[3]
+        block = '\n'.join(lines)
+
+        # Center align: anchor 'ma' centers the block on x, align centers each line
         draw = ImageDraw.Draw(img)
+        left, top, right, bottom = draw.multiline_textbbox(
+            (x, y), block, font=font, anchor='ma', spacing=spacing, align='center'
+        )
+        left, top = int(left), int(top)
+
+        if right > left and bottom > top:
+            # Rasterize the block once and use it as the mask for both passes
+            block_mask = Image.new('L', (int(right) - left + 1, int(bottom) - top + 1), 0)
+            ImageDraw.Draw(block_mask).multiline_text(
+                (x - left, y - top), block, font=font, fill=255,
+                anchor='ma', spacing=spacing, align='center'
+            )
 
-        lines = self._wrap_text(text, font, max_width)
-        if is_rtl:
-            lines = [self._prepare_arabic_text(line) for line in lines]
-
-        current_y = y
-
-        for line in lines:
-            bbox = font.getbbox(line)
-            line_width = bbox[2] - bbox[0]
-            line_height = bbox[3] - bbox[1]
-
-            # Center align
-            line_x = x - line_width // 2
-
-            # Draw shadow for depth
+            # Paste line by line, shadow then fill, so a line's shadow never
+            # covers the line above it; rows split halfway through the gap
             shadow_offset = 3
-            draw.text((line_x + shadow_offset, current_y + shadow_offset),
-                     line, font=font, fill=(0, 0, 0, 100))
+            gap = line_pitch - self._get_line_height(font)
+            for i in range(len(lines)):
+                row_start = 0 if i == 0 else y + i * line_pitch - gap // 2 - top
+                row_end = (block_mask.height if i == len(lines) - 1
+                           else y + (i + 1) * line_pitch - gap // 2 - top)
+                row_start = max(row_start, 0)
+                row_end = min(row_end, block_mask.height)
+                if row_end <= row_start:
+                    continue
 
-            # Draw main text
-            draw.text((line_x, current_y), line, font=font, fill=color)
+                line_mask = block_mask.crop((0, row_start, block_mask.width, row_end))
 
-            current_y += line_height + 15
+                # Draw shadow for depth
+                img.paste((0, 0, 0), (left + shadow_offset, top + row_start + shadow_offset),
+                          line_mask)
 
-        return current_y
+                # Draw main text
+                img.paste(color, (left, top + row_start), line_mask)
+
+        return y + line_pitch * len(lines)
 
     def _draw_subheadline(self, img: Image.Image, text: str, font: ImageFont.ImageFont,
                          x: int, y: int, max_width: int, color: Tuple[int, int, int],
-                         is_rtl: bool) -> int:
-        """Draw subheadline text. Returns new Y position."""
+                         is_rtl: bool,
+                         lines: Optional[List[str]] = None) -> int:
+        """Draw subheadline text (or pre-wrapped, pre-shaped lines). Returns new Y position."""
         draw = ImageDraw.Draw(img)
 
-        lines = self._wrap_text(text, font, max_width)
-        if is_rtl and self._is_rtl_text(text):
-            lines = [self._prepare_arabic_text(line) for line in lines]
-
-        current_y = y
+        if lines is None:
+            lines = self._shape_and_wrap(text, font, max_width,
+                                         is_rtl and self._is_rtl_text(text))
 
-        for line in lines:
-            bbox = font.getbbox(line)
-            line_width = bbox[2] - bbox[0]
-            line_height = bbox[3] - bbox[1]
+        if not lines:
+            return y
 
-            # Center align
-            line_x = x - line_width // 2
+        # Same line pitch as before, expressed as multiline spacing
+        line_pitch = self._get_line_height(font) + 10
+        spacing = line_pitch - font.getbbox('A')[3]
 
-            # Draw text
-            draw.text((line_x, current_y), line, font=font, fill=color)
+        # Center align on x
+        draw.multiline_text((x, y), '\n'.join(lines), font=font, fill=color,
+                            anchor='ma', spacing=spacing, align='center')
 
-            current_y += line_height + 10
-
-        return current_y
+        return y + line_pitch * len(lines)
 
     def _draw_cta_button(self, img: Image.Image, text: str, font: ImageFont.ImageFont,
                         x: int, y: int, is_rtl: bool):
         """Draw CTA button."""
-        draw = ImageDraw.Draw(img)
-
         # Detect RTL for CTA text specifically
         cta_is_rtl = self._is_rtl_text(text)
         
@@ -456,44 +523,17 @@ class HeadlinePromoLayout(PhotoLayoutEngine):
         else:
             display_text = text
 
-        # Measure text
-        bbox = font.getbbox(display_text)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
-
-        # Button dimensions
-        padding_x = 40
-        padding_y = 20
-        button_width = text_width + (padding_x * 2)
-        button_height = text_height + (padding_y * 2)
-        border_radius = 12
-
-        # Button position (centered)
-        button_x = x - button_width // 2
-        button_y = y
-
         # Button colors
         button_color = tuple(self.options.get('cta_bg_color', [255, 255, 255]))
         text_color = tuple(self.options.get('cta_text_color', [52, 73, 94]))
 
-        # Draw rounded rectangle button
-        draw.rounded_rectangle(
-            [(button_x, button_y), (button_x + button_width, button_y + button_height)],
-            radius=border_radius,
-            fill=button_color
-        )
+        sprite = _render_cta_sprite(display_text, font, button_color, text_color, cta_is_rtl)
 
-        # Draw text with proper RTL alignment
-        if cta_is_rtl:
-            # For RTL text, align right within button
-            text_x = button_x + button_width - padding_x - text_width
-        else:
-            # For LTR text, align left within button
-            text_x = button_x + padding_x
-        
-        text_y = button_y + padding_y
+        # Button position (centered)
+        button_x = x - (sprite.width - 1) // 2
+        button_y = y
 
-        draw.text((text_x, text_y), display_text, font=font, fill=text_color)
+        img.paste(sprite, (button_x, button_y), sprite)
 
     def get_schema(self) -> dict:
         """Get JSON schema for this layout."""
@@ -11,11 +11,22 @@ Perfect for: Quotes over photos, motivational posts, announcements with imagery
 """
 
 from .base import PhotoLayoutEngine, register_layout
+from ..utils.font_manager import load_font
 from PIL import Image, ImageDraw, ImageFont, ImageEnhance
 from typing import List, Tuple, Optional
 import os
 
 
+_FONT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                         'assets', 'fonts')
+
+# Font files used by this layout, resolved once at import
+_TEXT_FONT_RTL = os.path.join(_FONT_DIR, 'IRANYekanBoldFaNum.ttf')
+_TEXT_FONT_LTR = os.path.join(_FONT_DIR, 'NotoSans-Bold.ttf')
+_SUBTITLE_FONT_RTL = os.path.join(_FONT_DIR, 'IRANYekanRegularFaNum.ttf')
+_SUBTITLE_FONT_LTR = os.path.join(_FONT_DIR, 'NotoSans-Regular.ttf')
+
+
 @register_layout
 class OverlayTextLayout(PhotoLayoutEngine):
     """
@@ -77,26 +88,37 @@ class OverlayTextLayout(PhotoLayoutEngine):
         Returns:
             List containing single Image object
         """
-        # Load and prepare background image
-        canvas = self._create_background_image()
+        overlay_opacity = self.options.get('overlay_opacity', 0.4)
+        overlay_color = tuple(self.options.get('overlay_color', [0, 0, 0]))
 
-        # Apply overlay for better text readability
-        canvas = self._apply_overlay(canvas)
+        # Load background image with the readability overlay blended in
+        canvas = self._create_background_image(overlay_opacity, overlay_color)
 
         # Add text content
         canvas = self._add_overlay_text(canvas)
 
         return [canvas]
 
-    def _create_background_image(self) -> Image.Image:
-        """Load and fit background image to canvas."""
+    def _create_background_image(self, overlay_opacity: float = 0.0,
+                                 overlay_color: Tuple[int, int, int] = (0, 0, 0)) -> Image.Image:
+        """
+        Load and fit background image to canvas.
+
+        The dark/light readability overlay is blended into the fitted pixels
+        in the same pass, so the canvas is never re-composited afterwards.
+        """
         try:
-            from src.asset_manager import AssetManager
+            from ..asset_manager import get_asset_manager
 
-            # Load background image
-            asset_manager = AssetManager()
-            bg_image = asset_manager.load_asset(
+            # Load background image fitted to canvas size (cover mode - fill
+            # and crop); the fitted result is cached per URL and canvas size
+            asset_manager = get_asset_manager()
+            bg_image = asset_manager.load_fitted_asset(
                 self.assets['background_image_url'],
+                self.canvas_width,
+                self.canvas_height,
+                fit=self._fit_image,
+                mode='cover',
                 role='background',
                 use_cache=True,
                 remove_bg=self.remove_hero_bg,
@@ -105,45 +127,24 @@ class OverlayTextLayout(PhotoLayoutEngine):
                 color_tolerance=self.bg_color_tolerance
             )
 
-            # Fit to canvas size (cover mode - fill and crop)
-            bg_image = self._fit_image(
-                bg_image,
-                self.canvas_width,
-                self.canvas_height,
-                mode='cover'
-            )
+            if overlay_opacity <= 0:
+                return bg_image
 
-            return bg_image
+            return self._blend_color_overlay(bg_image, overlay_color, overlay_opacity)
 
         except Exception as e:
             # Fallback to solid color if image loading fails
-            fallback_color = self.options.get('fallback_color', [100, 100, 100])
-            return Image.new('RGB', (self.canvas_width, self.canvas_height), tuple(fallback_color))
-
-    def _apply_overlay(self, img: Image.Image) -> Image.Image:
-        """Apply dark/light overlay for better text readability."""
-        overlay_opacity = self.options.get('overlay_opacity', 0.4)
+            fallback_color = tuple(self.options.get('fallback_color', [100, 100, 100]))
 
-        if overlay_opacity <= 0:
-            return img
+            if overlay_opacity > 0:
+                # Blend the overlay into the fill color instead of the pixels
+                alpha = int(overlay_opacity * 255)
+                fallback_color = tuple(
+                    (c * (255 - alpha) + o * alpha + 127) // 255
+                    for c, o in zip(fallback_color[:3], overlay_color[:3])
+                )
 
-        # Create overlay
-        overlay = Image.new('RGBA', img.size, (0, 0, 0, 0))
-        draw = ImageDraw.Draw(overlay)
-
-        overlay_color = self.options.get('overlay_color', [0, 0, 0])
-        alpha = int(overlay_opacity * 255)
-
-        draw.rectangle(
-            [(0, 0), img.size],
-            fill=(*overlay_color, alpha)
-        )
-
-        # Convert img to RGBA and composite
-        img_rgba = img.convert('RGBA')
-        img_rgba = Image.alpha_composite(img_rgba, overlay)
-
-        return img_rgba.convert('RGB')
+            return Image.new('RGB', (self.canvas_width, self.canvas_height), fallback_color)
 
     def _add_overlay_text(self, canvas: Image.Image) -> Image.Image:
         """Add text overlay on the image."""
@@ -173,19 +174,16 @@ class OverlayTextLayout(PhotoLayoutEngine):
         margins = self._get_safe_margins()
         max_width = self.canvas_width - (margins['sides'] * 2)
 
-        # Prepare text
-        if is_rtl:
-            display_text = self._prepare_arabic_text(text)
-        else:
-            display_text = text
+        # Wrap and prepare text
+        lines = self._shape_and_wrap(text, text_font, max_width, is_rtl)
 
-        # Wrap text
-        lines = self._wrap_text(display_text, text_font, max_width)
+        # Measurements are reused by the draw loops below
+        bbox_cache = {}
 
         # Calculate total height
         line_heights = []
         for line in lines:
-            bbox = text_font.getbbox(line)
+            bbox = self._get_text_bbox(text_font, line, bbox_cache)
             line_heights.append(bbox[3] - bbox[1])
 
         total_text_height = sum(line_heights) + (len(lines) - 1) * 15
@@ -193,13 +191,11 @@ class OverlayTextLayout(PhotoLayoutEngine):
         # Add subtitle height if present
         subtitle_lines = []
         if subtitle:
-            if is_rtl and self._is_rtl_text(subtitle):
-                display_subtitle = self._prepare_arabic_text(subtitle)
-            else:
-                display_subtitle = subtitle
-
-            subtitle_lines = self._wrap_text(display_subtitle, subtitle_font, max_width)
-            subtitle_bbox = subtitle_font.getbbox(subtitle_lines[0] if subtitle_lines else subtitle)
+            subtitle_lines = self._shape_and_wrap(subtitle, subtitle_font, max_width,
+                                                  is_rtl and self._is_rtl_text(subtitle))
+            subtitle_bbox = self._get_text_bbox(subtitle_font,
+                                                subtitle_lines[0] if subtitle_lines else subtitle,
+                                                bbox_cache)
             subtitle_height = subtitle_bbox[3] - subtitle_bbox[1]
             total_text_height += subtitle_height * len(subtitle_lines) + 40
 
@@ -219,7 +215,7 @@ class OverlayTextLayout(PhotoLayoutEngine):
 
         # Draw main text
         for i, line in enumerate(lines):
-            bbox = text_font.getbbox(line)
+            bbox = self._get_text_bbox(text_font, line, bbox_cache)
             line_width = bbox[2] - bbox[0]
             line_height = bbox[3] - bbox[1]
 
@@ -239,7 +235,7 @@ class OverlayTextLayout(PhotoLayoutEngine):
             current_y += 25
 
             for line in subtitle_lines:
-                bbox = subtitle_font.getbbox(line)
+                bbox = self._get_text_bbox(subtitle_font, line, bbox_cache)
                 line_width = bbox[2] - bbox[0]
                 line_height = bbox[3] - bbox[1]
 
@@ -258,8 +254,6 @@ class OverlayTextLayout(PhotoLayoutEngine):
 
     def _draw_text_box_background(self, img: Image.Image, y: int, height: int, style: str):
         """Draw background box for text."""
-        draw = ImageDraw.Draw(img)
-
         margins = self._get_safe_margins()
         padding = 40
 
@@ -271,29 +265,31 @@ class OverlayTextLayout(PhotoLayoutEngine):
         box_color = tuple(self.options.get('text_box_color', [0, 0, 0]))
         box_opacity = self.options.get('text_box_opacity', 0.6)
 
-        # Create semi-transparent overlay
-        overlay = Image.new('RGBA', img.size, (0, 0, 0, 0))
+        # Create semi-transparent overlay covering only the box region
+        box_size = (x2 - x1 + 1, y2 - y1 + 1)
+        overlay = Image.new('RGBA', box_size, (0, 0, 0, 0))
         overlay_draw = ImageDraw.Draw(overlay)
 
         alpha = int(box_opacity * 255)
+        local_box = [(0, 0), (x2 - x1, y2 - y1)]
 
         if style == 'rounded':
             overlay_draw.rounded_rectangle(
-                [(x1, y1), (x2, y2)],
+                local_box,
                 radius=20,
                 fill=(*box_color, alpha)
             )
         elif style == 'pill':
             overlay_draw.rounded_rectangle(
-                [(x1, y1), (x2, y2)],
+                local_box,
                 radius=(y2 - y1) // 2,
                 fill=(*box_color, alpha)
             )
 
-        # Composite
-        img_rgba = img.convert('RGBA')
-        img_rgba = Image.alpha_composite(img_rgba, overlay)
-        img.paste(img_rgba.convert('RGB'), (0, 0))
+        # Composite against the same region of the canvas and write it back
+        region = img.crop((x1, y1, x2 + 1, y2 + 1)).convert('RGBA')
+        region.alpha_composite(overlay)
+        img.paste(region.convert('RGB'), (x1, y1))
 
     def _get_text_font(self, is_rtl: bool) -> ImageFont.ImageFont:
         """Get font for main text."""
@@ -301,16 +297,10 @@ class OverlayTextLayout(PhotoLayoutEngine):
         if is_rtl:
             font_size = int(font_size * 1.1)
 
-        font_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-                               'assets', 'fonts')
-
-        if is_rtl:
-            font_path = os.path.join(font_dir, 'IRANYekanBoldFaNum.ttf')
-        else:
-            font_path = os.path.join(font_dir, 'NotoSans-Bold.ttf')
+        font_path = _TEXT_FONT_RTL if is_rtl else _TEXT_FONT_LTR
 
         try:
-            return ImageFont.truetype(font_path, font_size)
+            return load_font(font_path, font_size)
         except:
             return ImageFont.load_default()
 
@@ -320,16 +310,10 @@ class OverlayTextLayout(PhotoLayoutEngine):
         if is_rtl:
             font_size = int(font_size * 1.1)
 
-        font_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-                               'assets', 'fonts')
-
-        if is_rtl:
-            font_path = os.path.join(font_dir, 'IRANYekanRegularFaNum.ttf')
-        else:
-            font_path = os.path.join(font_dir, 'NotoSans-Regular.ttf')
+        font_path = _SUBTITLE_FONT_RTL if is_rtl else _SUBTITLE_FONT_LTR
 
         try:
-            return ImageFont.truetype(font_path, font_size)
+            return load_font(font_path, font_size)
         except:
             return ImageFont.load_default()
 
@@ -13,11 +13,75 @@ Perfect for: E-commerce, product launches, sales, promotions
 """
 
 from .base import PhotoLayoutEngine, register_layout
+from ..utils.font_manager import load_font
+from ..asset_manager import get_asset_manager
 from PIL import Image, ImageDraw, ImageFont
 from typing import List, Tuple, Optional
+from functools import lru_cache
+import logging
 import os
 
 
+logger = logging.getLogger(__name__)
+
+
+_FONT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                         'assets', 'fonts')
+
+# Font files used by this layout, resolved once at import
+_FONT_LATIN_BOLD = os.path.join(_FONT_DIR, 'NotoSans-Bold.ttf')
+_FONT_LATIN_REGULAR = os.path.join(_FONT_DIR, 'NotoSans-Regular.ttf')
+_FONT_RTL_BOLD = os.path.join(_FONT_DIR, 'IRANYekanBoldFaNum.ttf')
+_FONT_RTL_REGULAR = os.path.join(_FONT_DIR, 'IRANYekanRegularFaNum.ttf')
+
+
+@lru_cache(maxsize=4096)
+def _measure(font: ImageFont.ImageFont, text: str) -> Tuple[int, int, int, int]:
+    """Measure text with font.getbbox, cached per (font, text)."""
+    return font.getbbox(text)
+
+
+@lru_cache(maxsize=64)
+def _rounded_button(width: int, height: int, radius: int,
+                    color: Tuple[int, ...]) -> Image.Image:
+    """
+    Rasterize a filled rounded-rectangle button shape into an RGBA tile.
+
+    Matches draw.rounded_rectangle([(0, 0), (width, height)]), which includes
+    its end coordinates, so the tile is one pixel larger than width x height.
+    The returned tile is shared and must not be modified.
+    """
+    tile = Image.new('RGBA', (width + 1, height + 1), (0, 0, 0, 0))
+    ImageDraw.Draw(tile).rounded_rectangle(
+        [(0, 0), (width, height)],
+        radius=radius,
+        fill=color
+    )
+    return tile
+
+
+@lru_cache(maxsize=256)
+def _text_mask(font: ImageFont.ImageFont, text: str) -> Tuple[Image.Image, Tuple[int, int]]:
+    """
+    Rasterize text once into a tight L mask.
+
+    Prices, currency symbols and CTA labels repeat across a batch, so the
+    rendered glyphs are cached per (font, text) and blitted with paste.
+    Whole strings are cached rather than single glyphs to keep kerning and
+    Arabic shaping intact. Fonts come from the shared font cache, so the
+    font object is a stable key. The returned mask is shared and must not
+    be modified.
+
+    Returns:
+        Tuple of (mask, (dx, dy)) where (dx, dy) is the mask offset from the
+        draw.text origin
+    """
+    left, top, right, bottom = _measure(font, text)
+    mask = Image.new('L', (max(right - left, 0), max(bottom - top, 0)), 0)
+    ImageDraw.Draw(mask).text((-left, -top), text, font=font, fill=255)
+    return mask, (left, top)
+
+
 @register_layout
 class ProductShowcaseLayout(PhotoLayoutEngine):
     """
@@ -86,10 +150,23 @@ class ProductShowcaseLayout(PhotoLayoutEngine):
         if 'hero_image_url' not in self.assets or not self.assets['hero_image_url']:
             raise ValueError("hero_image_url is required for product_showcase layout")
 
+        # Resolve option colors to tuples once for all the draw helpers
+        self._colors = {
+            'name': tuple(self.options.get('product_name_color', [52, 73, 94])),
+            'price': tuple(self.options.get('price_color', [220, 53, 69])),
+            'description': tuple(self.options.get('description_color', [100, 100, 100])),
+            'cta_bg': tuple(self.options.get('cta_bg_color', [52, 73, 94])),
+            'cta_text': tuple(self.options.get('cta_text_color', [255, 255, 255])),
+        }
+
     def render(self) -> List[Image.Image]:
         """
         Render the product showcase layout.
 
+        Every step draws into the one background canvas in place: the product
+        and logo are blitted into their own boxes and text is pasted from
+        cached glyph masks, so no full-canvas layer buffers are allocated.
+
         Returns:
             List containing single Image object
         """
@@ -109,8 +186,9 @@ class ProductShowcaseLayout(PhotoLayoutEngine):
         # Add product information
         canvas = self._add_product_info(canvas, layout_style)
         
-        # Add watermark if provided
-        canvas = self._add_watermark(canvas)
+        # Add watermark if provided (skip the call entirely when not configured)
+        if self.assets.get('watermark_url'):
+            canvas = self._add_watermark(canvas)
 
         return [canvas]
 
@@ -121,100 +199,98 @@ class ProductShowcaseLayout(PhotoLayoutEngine):
 
     def _add_product_image(self, canvas: Image.Image, layout_style: str) -> Image.Image:
         """Add product image to canvas."""
-        from ..asset_manager import get_asset_manager
-
         product_url = self.assets.get('hero_image_url')
-        print(f"🛍️  Adding product image from: {product_url}")
+        logger.debug("Adding product image from: %s", product_url)
 
         try:
+            # Target box for the fitted product; JPEGs only need decoding at
+            # twice this size for a clean LANCZOS downscale
+            if layout_style == 'center':
+                image_size = int(min(800, self.canvas_width * 0.7))
+                target_size = (image_size, image_size)
+            else:
+                target_size = (int(self.canvas_width * 0.5), self.canvas_height - 200)
+
+            # The fitted product is cached per URL, size and background removal
+            # settings, so batches of variants skip the fetch and the resize
             asset_manager = get_asset_manager()
-            print(f"📂 Loading product image asset: {product_url}")
-            product_image = asset_manager.load_asset(
+            fitted_image = asset_manager.load_fitted_asset(
                 self.assets['hero_image_url'],
+                target_size[0],
+                target_size[1],
+                fit=lambda image, width, height, mode: asset_manager.resize_to_fit(image, width, height),
+                mode='contain',
                 role='hero_image',
                 remove_bg=self.remove_hero_bg,
                 bg_removal_method=self.bg_removal_method,
                 alpha_matting=self.bg_alpha_matting,
-                color_tolerance=self.bg_color_tolerance
+                color_tolerance=self.bg_color_tolerance,
+                draft_size=(target_size[0] * 2, target_size[1] * 2)
             )
-            print(f"✅ Product image loaded successfully! Size: {product_image.size}")
-            print(f"   Layout style: {layout_style}")
 
             if layout_style == 'center':
                 # Center layout - product image in upper-middle area
-                image_size = int(min(800, self.canvas_width * 0.7))
-                fitted_image = asset_manager.resize_to_fit(
-                    product_image,
-                    image_size,
-                    image_size,
-                    maintain_aspect=True
-                )
-                print(f"   Product fitted to size: {fitted_image.size}")
-
                 # Center horizontally, position in upper third
                 x_pos = (self.canvas_width - fitted_image.size[0]) // 2
                 y_pos = 150
-
-                canvas.paste(fitted_image, (x_pos, y_pos))
-                print(f"   Placed at position: ({x_pos}, {y_pos})")
-
             else:  # side layout
                 # Side layout - product on left, info on right
-                image_width = int(self.canvas_width * 0.5)
-                fitted_image = asset_manager.resize_to_fit(
-                    product_image,
-                    image_width,
-                    self.canvas_height - 200,
-                    maintain_aspect=True
-                )
-                print(f"   Product fitted to size: {fitted_image.size}")
-
                 # Center in left half
-                x_pos = (image_width - fitted_image.size[0]) // 2
+                x_pos = (target_size[0] - fitted_image.size[0]) // 2
                 y_pos = (self.canvas_height - fitted_image.size[1]) // 2
 
-                canvas.paste(fitted_image, (x_pos, y_pos))
-                print(f"   Placed at position: ({x_pos}, {y_pos})")
+            self._paste_product(canvas, fitted_image, (x_pos, y_pos))
+            logger.debug("Product fitted to %s, placed at (%d, %d), layout style %s",
+                         fitted_image.size, x_pos, y_pos, layout_style)
 
-            print(f"✅ Product image added successfully!")
             return canvas
 
         except Exception as e:
-            print(f"❌ ERROR: Could not load product image: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Could not load product image: %s", e)
             return canvas
 
+    def _paste_product(self, canvas: Image.Image, product: Image.Image, xy: Tuple[int, int]):
+        """Paste the fitted product, blending cut-out (RGBA) products by their alpha."""
+        if product.mode == 'RGBA' and product.getchannel('A').getextrema() != (255, 255):
+            self._composite_over(canvas, product, xy)
+            return
+
+        # Opaque product (including RGBA with a solid alpha): match the canvas
+        # mode up front so paste is a straight copy with no per-pixel conversion
+        if product.mode != canvas.mode:
+            product = product.convert(canvas.mode)
+        canvas.paste(product, xy)
+
     def _add_logo(self, canvas: Image.Image) -> Image.Image:
         """Add brand logo to canvas (top-right corner)."""
-        from ..asset_manager import get_asset_manager
-
         try:
             asset_manager = get_asset_manager()
-            logo = asset_manager.load_asset(
+
+            # Resize logo to reasonable size; the fitted logo is cached per URL
+            logo_size = 100
+            logo_fitted = asset_manager.load_fitted_asset(
                 self.assets['logo_image_url'],
+                logo_size,
+                logo_size,
+                fit=lambda image, width, height, mode: asset_manager.resize_to_fit(image, width, height),
+                mode='contain',
                 role='logo_image'
             )
 
-            # Resize logo to reasonable size
-            logo_size = 100
-            logo_fitted = asset_manager.resize_to_fit(logo, logo_size, logo_size)
-
             # Position in top-right with padding
             x_pos = self.canvas_width - logo_fitted.size[0] - 40
             y_pos = 40
 
-            # Convert to RGBA if needed
-            if logo_fitted.mode != 'RGBA':
-                logo_fitted = logo_fitted.convert('RGBA')
-
-            # Paste with alpha
-            canvas.paste(logo_fitted, (x_pos, y_pos), logo_fitted if logo_fitted.mode == 'RGBA' else None)
+            # Paste with alpha; opaque logos need no mask (and no RGBA copy)
+            if logo_fitted.mode == 'RGBA':
+                canvas.paste(logo_fitted, (x_pos, y_pos), logo_fitted)
+            else:
+                canvas.paste(logo_fitted, (x_pos, y_pos))
 
             return canvas
 
         except Exception as e:
-            print(f"Warning: Could not load logo: {e}")
+            logger.warning("Could not load logo: %s", e)
             return canvas
 
     def _add_product_info(self, canvas: Image.Image, layout_style: str) -> Image.Image:
@@ -241,26 +317,29 @@ class ProductShowcaseLayout(PhotoLayoutEngine):
             # Center layout - info below product image
             info_y_start = 1000  # Below product image
 
+            # Shape RTL strings once up front; centered text is drawn unwrapped
+            if is_rtl:
+                product_name = self._prepare_arabic_text(product_name)
+                if description:
+                    description = self._prepare_arabic_text(description)
+
             # Product name
             current_y = info_y_start
-            name_color = self.options.get('product_name_color', [52, 73, 94])
             current_y = self._draw_centered_text(
                 canvas, product_name, name_font,
-                current_y, tuple(name_color), is_rtl
+                current_y, self._colors['name']
             )
 
             # Price
             current_y += 20
-            price_color = self.options.get('price_color', [220, 53, 69])
-            current_y = self._draw_price(canvas, price, price_font, current_y, tuple(price_color))
+            current_y = self._draw_price(canvas, price, price_font, current_y, self._colors['price'])
 
             # Description
             if description:
                 current_y += 30
-                desc_color = self.options.get('description_color', [100, 100, 100])
                 current_y = self._draw_centered_text(
                     canvas, description, desc_font,
-                    current_y, tuple(desc_color), is_rtl
+                    current_y, self._colors['description']
                 )
 
             # CTA
@@ -276,26 +355,23 @@ class ProductShowcaseLayout(PhotoLayoutEngine):
             current_y = 300
 
             # Product name
-            name_color = self.options.get('product_name_color', [52, 73, 94])
             current_y = self._draw_left_aligned_text(
                 canvas, product_name, name_font,
                 info_x, current_y, max_width,
-                tuple(name_color), is_rtl
+                self._colors['name'], is_rtl, draw
             )
 
             # Price
             current_y += 30
-            price_color = self.options.get('price_color', [220, 53, 69])
-            current_y = self._draw_price_left(canvas, price, price_font, info_x, current_y, tuple(price_color))
+            current_y = self._draw_price_left(canvas, price, price_font, info_x, current_y, self._colors['price'])
 
             # Description
             if description:
                 current_y += 40
-                desc_color = self.options.get('description_color', [100, 100, 100])
                 current_y = self._draw_left_aligned_text(
                     canvas, description, desc_font,
                     info_x, current_y, max_width,
-                    tuple(desc_color), is_rtl
+                    self._colors['description'], is_rtl, draw
                 )
 
             # CTA
@@ -311,16 +387,10 @@ class ProductShowcaseLayout(PhotoLayoutEngine):
         if is_rtl:
             font_size = int(font_size * 1.1)
 
-        font_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-                               'assets', 'fonts')
-
-        if is_rtl:
-            font_path = os.path.join(font_dir, 'IRANYekanBoldFaNum.ttf')
-        else:
-            font_path = os.path.join(font_dir, 'NotoSans-Bold.ttf')
+        font_path = _FONT_RTL_BOLD if is_rtl else _FONT_LATIN_BOLD
 
         try:
-            return ImageFont.truetype(font_path, font_size)
+            return load_font(font_path, font_size)
         except:
             return ImageFont.load_default()
 
@@ -328,12 +398,10 @@ class ProductShowcaseLayout(PhotoLayoutEngine):
         """Get font for price."""
         font_size = self.options.get('price_size', 72)
 
-        font_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-                               'assets', 'fonts')
-        font_path = os.path.join(font_dir, 'NotoSans-Bold.ttf')
+        font_path = _FONT_LATIN_BOLD
 
         try:
-            return ImageFont.truetype(font_path, font_size)
+            return load_font(font_path, font_size)
         except:
             return ImageFont.load_default()
 
@@ -343,16 +411,10 @@ class ProductShowcaseLayout(PhotoLayoutEngine):
         if is_rtl:
             font_size = int(font_size * 1.1)
 
-        font_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-                               'assets', 'fonts')
-
-        if is_rtl:
-            font_path = os.path.join(font_dir, 'IRANYekanRegularFaNum.ttf')
-        else:
-            font_path = os.path.join(font_dir, 'NotoSans-Regular.ttf')
+        font_path = _FONT_RTL_REGULAR if is_rtl else _FONT_LATIN_REGULAR
 
         try:
-            return ImageFont.truetype(font_path, font_size)
+            return load_font(font_path, font_size)
         except:
             return ImageFont.load_default()
 
@@ -360,50 +422,48 @@ class ProductShowcaseLayout(PhotoLayoutEngine):
         """Get font for CTA."""
         font_size = self.options.get('cta_size', 32)
 
-        font_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-                               'assets', 'fonts')
-        font_path = os.path.join(font_dir, 'NotoSans-Bold.ttf')
+        font_path = _FONT_LATIN_BOLD
 
         try:
-            return ImageFont.truetype(font_path, font_size)
+            return load_font(font_path, font_size)
         except:
             return ImageFont.load_default()
 
-    def _draw_centered_text(self, img: Image.Image, text: str, font: ImageFont.ImageFont,
-                           y: int, color: Tuple[int, int, int], is_rtl: bool) -> int:
-        """Draw centered text. Returns new Y position."""
-        draw = ImageDraw.Draw(img)
+    def _paste_text(self, img: Image.Image, xy: Tuple[int, int], text: str,
+                    font: ImageFont.ImageFont, color: Tuple[int, int, int]):
+        """Draw text like draw.text, blitting the cached mask from _text_mask."""
+        mask, (dx, dy) = _text_mask(font, text)
+        if mask.width and mask.height:
+            img.paste(color, (xy[0] + dx, xy[1] + dy), mask)
 
-        if is_rtl:
-            text = self._prepare_arabic_text(text)
-
-        bbox = font.getbbox(text)
+    def _draw_centered_text(self, img: Image.Image, text: str, font: ImageFont.ImageFont,
+                           y: int, color: Tuple[int, int, int]) -> int:
+        """Draw centered, display-ready (already shaped) text. Returns new Y position."""
+        bbox = _measure(font, text)
         text_width = bbox[2] - bbox[0]
         text_height = bbox[3] - bbox[1]
 
         x = (self.canvas_width - text_width) // 2
 
-        draw.text((x, y), text, font=font, fill=color)
+        self._paste_text(img, (x, y), text, font, color)
 
         return y + text_height
 
     def _draw_left_aligned_text(self, img: Image.Image, text: str, font: ImageFont.ImageFont,
                                x: int, y: int, max_width: int, color: Tuple[int, int, int],
-                               is_rtl: bool) -> int:
+                               is_rtl: bool, draw: Optional[ImageDraw.ImageDraw] = None) -> int:
         """Draw left-aligned text with wrapping. Returns new Y position."""
-        draw = ImageDraw.Draw(img)
+        if draw is None:
+            draw = ImageDraw.Draw(img)
 
-        if is_rtl:
-            text = self._prepare_arabic_text(text)
-
-        lines = self._wrap_text(text, font, max_width)
+        # Wrap in logical order (break points from cached char advances), then
+        # shape each line, so RTL lines keep their reading order
+        lines = self._shape_and_wrap(text, font, max_width, is_rtl)
 
         current_y = y
+        line_height = self._get_line_height(font)
 
         for line in lines:
-            bbox = font.getbbox(line)
-            line_height = bbox[3] - bbox[1]
-
             draw.text((x, current_y), line, font=font, fill=color)
 
             current_y += line_height + 10
@@ -413,8 +473,6 @@ class ProductShowcaseLayout(PhotoLayoutEngine):
     def _draw_price(self, img: Image.Image, price: str, font: ImageFont.ImageFont,
                    y: int, color: Tuple[int, int, int]) -> int:
         """Draw price (centered). Returns new Y position."""
-        draw = ImageDraw.Draw(img)
-
         # Format price
         show_currency = self.options.get('show_currency', True)
         currency_symbol = self.options.get('currency_symbol', '$')
@@ -424,21 +482,19 @@ class ProductShowcaseLayout(PhotoLayoutEngine):
         else:
             price_text = price
 
-        bbox = font.getbbox(price_text)
+        bbox = _measure(font, price_text)
         text_width = bbox[2] - bbox[0]
         text_height = bbox[3] - bbox[1]
 
         x = (self.canvas_width - text_width) // 2
 
-        draw.text((x, y), price_text, font=font, fill=color)
+        self._paste_text(img, (x, y), price_text, font, color)
 
         return y + text_height
 
     def _draw_price_left(self, img: Image.Image, price: str, font: ImageFont.ImageFont,
                         x: int, y: int, color: Tuple[int, int, int]) -> int:
         """Draw price (left-aligned). Returns new Y position."""
-        draw = ImageDraw.Draw(img)
-
         # Format price
         show_currency = self.options.get('show_currency', True)
         currency_symbol = self.options.get('currency_symbol', '$')
@@ -448,20 +504,18 @@ class ProductShowcaseLayout(PhotoLayoutEngine):
         else:
             price_text = price
 
-        bbox = font.getbbox(price_text)
+        bbox = _measure(font, price_text)
         text_height = bbox[3] - bbox[1]
 
-        draw.text((x, y), price_text, font=font, fill=color)
+        self._paste_text(img, (x, y), price_text, font, color)
 
         return y + text_height
 
     def _draw_cta_button(self, img: Image.Image, text: str, font: ImageFont.ImageFont,
                         x: int, y: int):
         """Draw CTA button."""
-        draw = ImageDraw.Draw(img)
-
         # Measure text
-        bbox = font.getbbox(text)
+        bbox = _measure(font, text)
         text_width = bbox[2] - bbox[0]
         text_height = bbox[3] - bbox[1]
 
@@ -477,21 +531,18 @@ class ProductShowcaseLayout(PhotoLayoutEngine):
         button_y = y
 
         # Button colors
-        button_color = tuple(self.options.get('cta_bg_color', [52, 73, 94]))
-        text_color = tuple(self.options.get('cta_text_color', [255, 255, 255]))
+        button_color = self._colors['cta_bg']
+        text_color = self._colors['cta_text']
 
-        # Draw rounded rectangle button
-        draw.rounded_rectangle(
-            [(button_x, button_y), (button_x + button_width, button_y + button_height)],
-            radius=border_radius,
-            fill=button_color
-        )
+        # Draw rounded rectangle button from the cached shape
+        button = _rounded_button(button_width, button_height, border_radius, button_color)
+        img.paste(button, (button_x, button_y), button)
 
         # Draw text
         text_x = button_x + padding_x
         text_y = button_y + padding_y
 
-        draw.text((text_x, text_y), text, font=font, fill=text_color)
+        self._paste_text(img, (text_x, text_y), text, font, text_color)
 
     def get_schema(self) -> dict:
         """Get JSON schema for this layout."""
@@ -9,11 +9,33 @@ Perfect for: Product features, services, educational content with visuals
 """
 
 from .base import PhotoLayoutEngine, register_layout
+from ..utils.font_manager import load_font
+from ..utils import profiling
 from PIL import Image, ImageDraw, ImageFont
 from typing import List, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor
 import os
 
 
+_FONT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                         'assets', 'fonts')
+
+# Font files used by this layout, resolved once at import
+_FONT_LATIN_BOLD = os.path.join(_FONT_DIR, 'NotoSans-Bold.ttf')
+_FONT_LATIN_REGULAR = os.path.join(_FONT_DIR, 'NotoSans-Regular.ttf')
+_FONT_RTL_BOLD = os.path.join(_FONT_DIR, 'IRANYekanBoldFaNum.ttf')
+_FONT_RTL_MEDIUM = os.path.join(_FONT_DIR, 'IRANYekanMediumFaNum.ttf')
+_FONT_RTL_REGULAR = os.path.join(_FONT_DIR, 'IRANYekanRegularFaNum.ttf')
+
+# Whether each font file exists, checked once at import so a missing font
+# falls back to the default font without raising on every render
+_FONT_AVAILABLE = {
+    path: os.path.isfile(path)
+    for path in (_FONT_LATIN_BOLD, _FONT_LATIN_REGULAR,
+                 _FONT_RTL_BOLD, _FONT_RTL_MEDIUM, _FONT_RTL_REGULAR)
+}
+
+
 @register_layout
 class SplitImageTextLayout(PhotoLayoutEngine):
     """
@@ -31,6 +53,7 @@ class SplitImageTextLayout(PhotoLayoutEngine):
         - split_direction: 'vertical' (default) or 'horizontal'
         - image_position: 'left' or 'right' (for vertical), 'top' or 'bottom' (for horizontal)
         - image_ratio: 0.0-1.0 (default: 0.5 for 50/50 split)
+        - fast_preview: true to fit the image with BILINEAR instead of LANCZOS
 
     Example:
         {
@@ -88,11 +111,21 @@ class SplitImageTextLayout(PhotoLayoutEngine):
         # Validate ratio
         image_ratio = max(0.3, min(0.7, image_ratio))  # Clamp between 30%-70%
 
-        # Load and place hero image
-        canvas = self._add_split_image(canvas, split_direction, image_position, image_ratio)
+        # Fetch and crop the hero image on a worker thread while the text half
+        # is laid out; HTTP and resampling release the GIL, and the two halves
+        # do not overlap, so the drawing order does not matter
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            hero_future = executor.submit(
+                self._prepare_split_image, split_direction, image_position, image_ratio
+            )
+
+            # Add text content
+            canvas = self._add_split_text(canvas, split_direction, image_position, image_ratio)
 
-        # Add text content
-        canvas = self._add_split_text(canvas, split_direction, image_position, image_ratio)
+            # Place hero image (re-raises any load error from the worker)
+            fitted_image, position = hero_future.result()
+
+        canvas.paste(fitted_image, position)
 
         return [canvas]
 
@@ -104,6 +137,21 @@ class SplitImageTextLayout(PhotoLayoutEngine):
     def _add_split_image(self, canvas: Image.Image, split_direction: str,
                         image_position: str, image_ratio: float) -> Image.Image:
         """Add hero image to canvas in split configuration."""
+        fitted_image, position = self._prepare_split_image(split_direction, image_position, image_ratio)
+        canvas.paste(fitted_image, position)
+        return canvas
+
+    @profiling.section('split_image_text.image')
+    def _prepare_split_image(self, split_direction: str, image_position: str,
+                             image_ratio: float) -> Tuple[Image.Image, Tuple[int, int]]:
+        """
+        Load the hero image and crop it to its half of the split.
+
+        Does not touch the canvas, so it can run alongside the text layout.
+
+        Returns:
+            Tuple of (fitted image, paste position)
+        """
         from ..asset_manager import get_asset_manager
         import traceback
 
@@ -125,6 +173,12 @@ class SplitImageTextLayout(PhotoLayoutEngine):
             )
             print(f"✅ Hero image loaded successfully! Size: {hero_image.size}")
 
+            # Previews trade LANCZOS quality for a much cheaper BILINEAR resize
+            if self.options.get('fast_preview', False):
+                resample = Image.Resampling.BILINEAR
+            else:
+                resample = Image.Resampling.LANCZOS
+
             if split_direction == 'vertical':
                 # Vertical split (left/right)
                 image_width = int(self.canvas_width * image_ratio)
@@ -133,15 +187,16 @@ class SplitImageTextLayout(PhotoLayoutEngine):
                 fitted_image = asset_manager.smart_crop(
                     hero_image,
                     (image_width, self.canvas_height),
-                    focus='center'
+                    focus='center',
+                    resample=resample
                 )
 
-                # Paste image
+                # Image position
                 if image_position == 'left':
-                    canvas.paste(fitted_image, (0, 0))
+                    position = (0, 0)
                 else:  # right
                     x_pos = self.canvas_width - image_width
-                    canvas.paste(fitted_image, (x_pos, 0))
+                    position = (x_pos, 0)
 
             else:  # horizontal
                 # Horizontal split (top/bottom)
@@ -151,18 +206,25 @@ class SplitImageTextLayout(PhotoLayoutEngine):
                 fitted_image = asset_manager.smart_crop(
                     hero_image,
                     (self.canvas_width, image_height),
-                    focus='center'
+                    focus='center',
+                    resample=resample
                 )
 
-                # Paste image
+                # Image position
                 if image_position == 'top':
-                    canvas.paste(fitted_image, (0, 0))
+                    position = (0, 0)
                 else:  # bottom
                     y_pos = self.canvas_height - image_height
-                    canvas.paste(fitted_image, (0, y_pos))
+                    position = (0, y_pos)
+
+            # The canvas is RGB; matching it here (on the worker thread) keeps
+            # the final paste a straight row copy. Paste without a mask ignores
+            # alpha anyway, so the result is unchanged
+            if fitted_image.mode != 'RGB':
+                fitted_image = fitted_image.convert('RGB')
 
-            print(f"✅ Hero image placed successfully in split layout")
-            return canvas
+            print(f"✅ Hero image prepared successfully for split layout")
+            return fitted_image, position
 
         except ValueError as e:
             # Re-raise ValueError with more context
@@ -178,6 +240,7 @@ class SplitImageTextLayout(PhotoLayoutEngine):
             traceback.print_exc()
             raise ValueError(error_msg) from e
 
+    @profiling.section('split_image_text.text')
     def _add_split_text(self, canvas: Image.Image, split_direction: str,
                        image_position: str, image_ratio: float) -> Image.Image:
         """Add text content to the text half of the split layout."""
@@ -232,7 +295,7 @@ class SplitImageTextLayout(PhotoLayoutEngine):
         current_y = self._draw_title(
             canvas, title, title_font,
             text_x, current_y, text_width,
-            tuple(title_color), is_rtl
+            tuple(title_color), is_rtl, draw
         )
 
         # Draw description
@@ -242,7 +305,7 @@ class SplitImageTextLayout(PhotoLayoutEngine):
             current_y = self._draw_description(
                 canvas, description, desc_font,
                 text_x, current_y, text_width,
-                tuple(desc_color), is_rtl
+                tuple(desc_color), is_rtl, draw
             )
 
         # Draw bullets
@@ -252,7 +315,7 @@ class SplitImageTextLayout(PhotoLayoutEngine):
             self._draw_bullets(
                 canvas, bullets, bullet_font,
                 text_x, current_y, text_width,
-                tuple(bullet_color), is_rtl
+                tuple(bullet_color), is_rtl, draw
             )
 
         return canvas
@@ -263,18 +326,11 @@ class SplitImageTextLayout(PhotoLayoutEngine):
         if is_rtl:
             font_size = int(font_size * 1.1)
 
-        font_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-                               'assets', 'fonts')
+        font_path = _FONT_RTL_BOLD if is_rtl else _FONT_LATIN_BOLD
 
-        if is_rtl:
-            font_path = os.path.join(font_dir, 'IRANYekanBoldFaNum.ttf')
-        else:
-            font_path = os.path.join(font_dir, 'NotoSans-Bold.ttf')
-
-        try:
-            return ImageFont.truetype(font_path, font_size)
-        except:
-            return ImageFont.load_default()
+        if _FONT_AVAILABLE[font_path]:
+            return load_font(font_path, font_size)
+        return ImageFont.load_default()
 
     def _get_description_font(self, is_rtl: bool) -> ImageFont.ImageFont:
         """Get font for description."""
@@ -282,18 +338,11 @@ class SplitImageTextLayout(PhotoLayoutEngine):
         if is_rtl:
             font_size = int(font_size * 1.1)
 
-        font_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-                               'assets', 'fonts')
+        font_path = _FONT_RTL_MEDIUM if is_rtl else _FONT_LATIN_REGULAR
 
-        if is_rtl:
-            font_path = os.path.join(font_dir, 'IRANYekanMediumFaNum.ttf')
-        else:
-            font_path = os.path.join(font_dir, 'NotoSans-Regular.ttf')
-
-        try:
-            return ImageFont.truetype(font_path, font_size)
-        except:
-            return ImageFont.load_default()
+        if _FONT_AVAILABLE[font_path]:
+            return load_font(font_path, font_size)
+        return ImageFont.load_default()
 
     def _get_bullet_font(self, is_rtl: bool) -> ImageFont.ImageFont:
         """Get font for bullets."""
@@ -301,89 +350,83 @@ class SplitImageTextLayout(PhotoLayoutEngine):
         if is_rtl:
             font_size = int(font_size * 1.1)
 
-        font_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-                               'assets', 'fonts')
-
-        if is_rtl:
-            font_path = os.path.join(font_dir, 'IRANYekanRegularFaNum.ttf')
-        else:
-            font_path = os.path.join(font_dir, 'NotoSans-Regular.ttf')
+        font_path = _FONT_RTL_REGULAR if is_rtl else _FONT_LATIN_REGULAR
 
-        try:
-            return ImageFont.truetype(font_path, font_size)
-        except:
-            return ImageFont.load_default()
+        if _FONT_AVAILABLE[font_path]:
+            return load_font(font_path, font_size)
+        return ImageFont.load_default()
 
     def _draw_title(self, img: Image.Image, text: str, font: ImageFont.ImageFont,
                    x: int, y: int, max_width: int, color: Tuple[int, int, int],
-                   is_rtl: bool) -> int:
+                   is_rtl: bool, draw: Optional[ImageDraw.ImageDraw] = None) -> int:
         """Draw title text. Returns new Y position."""
-        draw = ImageDraw.Draw(img)
-
-        # Prepare text
-        if is_rtl:
-            text = self._prepare_arabic_text(text)
-
-        # Wrap text
-        lines = self._wrap_text(text, font, max_width)
-
-        current_y = y
+        if draw is None:
+            draw = ImageDraw.Draw(img)
 
-        for line in lines:
-            bbox = font.getbbox(line)
-            line_width = bbox[2] - bbox[0]
-            line_height = bbox[3] - bbox[1]
+        # Wrap in logical order, then shape each line (memoized per font and width)
+        lines = self._shape_and_wrap(text, font, max_width, is_rtl)
 
-            # Left align for split layout
-            line_x = x
+        # Line pitch is a font metric; multiline_text takes it as the extra
+        # spacing on top of the height of 'A'
+        line_pitch = self._get_line_height(font) + 15
+        spacing = line_pitch - font.getbbox('A')[3]
 
-            # Draw text
-            draw.text((line_x, current_y), line, font=font, fill=color)
+        # Left align for split layout, the whole block in one call
+        draw.multiline_text((x, y), '\n'.join(lines), font=font, fill=color,
+                            spacing=spacing)
 
-            current_y += line_height + 15
-
-        return current_y
+        return y + line_pitch * len(lines)
 
     def _draw_description(self, img: Image.Image, text: str, font: ImageFont.ImageFont,
                          x: int, y: int, max_width: int, color: Tuple[int, int, int],
-                         is_rtl: bool) -> int:
+                         is_rtl: bool, draw: Optional[ImageDraw.ImageDraw] = None) -> int:
         """Draw description text. Returns new Y position."""
-        draw = ImageDraw.Draw(img)
-
-        # Prepare text
-        if is_rtl and self._is_rtl_text(text):
-            text = self._prepare_arabic_text(text)
-
-        # Wrap text
-        lines = self._wrap_text(text, font, max_width)
-
-        current_y = y
-
-        for line in lines:
-            bbox = font.getbbox(line)
-            line_width = bbox[2] - bbox[0]
-            line_height = bbox[3] - bbox[1]
+        if draw is None:
+            draw = ImageDraw.Draw(img)
 
-            # Left align
-            line_x = x
+        # Wrap in logical order, then shape each line (memoized per font and width)
+        lines = self._shape_and_wrap(text, font, max_width,
+                                     is_rtl and self._is_rtl_text(text))
 
-            # Draw text
-            draw.text((line_x, current_y), line, font=font, fill=color)
+        # Line pitch is a font metric; multiline_text takes it as the extra
+        # spacing on top of the height of 'A'
+        line_pitch = self._get_line_height(font) + 10
+        spacing = line_pitch - font.getbbox('A')[3]
 
-            current_y += line_height + 10
+        # Left align, the whole block in one call
+        draw.multiline_text((x, y), '\n'.join(lines), font=font, fill=color,
+                            spacing=spacing)
 
-        return current_y
+        return y + line_pitch * len(lines)
 
     def _draw_bullets(self, img: Image.Image, bullets: List[str], font: ImageFont.ImageFont,
                      x: int, y: int, max_width: int, color: Tuple[int, int, int],
-                     is_rtl: bool):
+                     is_rtl: bool, draw: Optional[ImageDraw.ImageDraw] = None):
         """Draw bullet points with drawn shapes instead of Unicode characters."""
-        draw = ImageDraw.Draw(img)
+        if draw is None:
+            draw = ImageDraw.Draw(img)
 
         current_y = y
         bullet_size = 12  # Larger, more visible bullet circle
         bullet_spacing = 20  # Space between bullet and text
 
+        # Every bullet is a single line, so one font metric gives the height
+        text_height = self._get_line_height(font)
+
+        # The bullet marker is identical on every row: fix its column, the
+        # text column and its offset from the row top once
+        if is_rtl:
+            # For RTL, bullet goes on the right side, text on the left
+            bullet_x = x + max_width - bullet_size
+            text_x = x
+        else:
+            # For LTR, bullet goes on the left, text after it
+            bullet_x = x
+            text_x = x + bullet_size + bullet_spacing
+        # Bullet vertically centered with the text
+        dot_top = text_height // 2 - bullet_size // 2
+        dot_bottom = text_height // 2 + bullet_size // 2
+
         for bullet_text in bullets:
             # Prepare text
             if is_rtl and self._is_rtl_text(bullet_text):
@@ -391,36 +434,10 @@ class SplitImageTextLayout(PhotoLayoutEngine):
             else:
                 display_text = bullet_text
 
-            # Measure text height for proper alignment
-            bbox = font.getbbox(display_text)
-            text_height = bbox[3] - bbox[1]
-            text_width = bbox[2] - bbox[0]
-            
-            # Calculate bullet center position (vertically centered with text)
-            bullet_center_y = current_y + text_height // 2
-            
-            # Adjust for RTL
-            if is_rtl:
-                # For RTL, bullet goes on the right side
-                # Position text on the left
-                text_x = x
-                draw.text((text_x, current_y), display_text, font=font, fill=color)
-                
-                # Position bullet on the right side
-                bullet_x = x + max_width - bullet_size
-                draw.ellipse([bullet_x, bullet_center_y - bullet_size//2, 
-                             bullet_x + bullet_size, bullet_center_y + bullet_size//2], 
-                            fill=color)
-            else:
-                # For LTR, bullet goes on the left
-                bullet_x = x
-                draw.ellipse([bullet_x, bullet_center_y - bullet_size//2, 
-                             bullet_x + bullet_size, bullet_center_y + bullet_size//2], 
-                            fill=color)
-                
-                # Then draw text
-                text_x = x + bullet_size + bullet_spacing
-                draw.text((text_x, current_y), display_text, font=font, fill=color)
+            draw.ellipse([bullet_x, current_y + dot_top,
+                          bullet_x + bullet_size, current_y + dot_bottom],
+                         fill=color)
+            draw.text((text_x, current_y), display_text, font=font, fill=color)
 
             # Move to next bullet with better spacing
             current_y += text_height + 30
@@ -436,6 +453,7 @@ class SplitImageTextLayout(PhotoLayoutEngine):
                 "split_direction": "'vertical' (default) or 'horizontal'",
                 "image_position": "'left'/'right' (vertical) or 'top'/'bottom' (horizontal)",
                 "image_ratio": "0.3-0.7 (default: 0.5 for 50/50 split)",
+                "fast_preview": "Fit the image with BILINEAR instead of LANCZOS (default: false)",
                 "title_size": "Font size for title (default: 56)",
                 "description_size": "Font size for description (default: 32)",
                 "bullet_size": "Font size for bullets (default: 28)",
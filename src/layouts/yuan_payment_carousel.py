@@ -14,15 +14,353 @@ Perfect for: Educational carousels, marketing campaigns, brand content
 """
 
 from .base import CarouselLayoutEngine, register_layout
+from ..utils.font_manager import load_font
+from ..asset_manager import get_asset_manager
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 from typing import List, Tuple, Optional, Dict, Any
+from functools import lru_cache
 import os
 import random
 import requests
+from requests.adapters import HTTPAdapter
 import re
 from io import BytesIO
 
 
+_ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                           'assets')
+_FONT_DIR = os.path.join(_ASSETS_DIR, 'fonts')
+_YUAN_ASSETS_DIR = os.path.join(_ASSETS_DIR, 'yuan_payment')
+
+# Font files used by this layout, resolved once at import
+_FONT_LATIN_BOLD = os.path.join(_FONT_DIR, 'NotoSans-Bold.ttf')
+_FONT_LATIN_REGULAR = os.path.join(_FONT_DIR, 'NotoSans-Regular.ttf')
+_FONT_RTL_BOLD = os.path.join(_FONT_DIR, 'IRANYekanBoldFaNum.ttf')
+_FONT_RTL_MEDIUM = os.path.join(_FONT_DIR, 'IRANYekanMediumFaNum.ttf')
+_FONT_RTL_REGULAR = os.path.join(_FONT_DIR, 'IRANYekanRegularFaNum.ttf')
+
+# Alpha lookup table for the 20%-opacity background image in the gradient
+# layout, built once instead of calling a lambda 256 times per render
+_SUBTLE_ALPHA_LUT = [int(p * 0.2) for p in range(256)]
+
+
+@lru_cache(maxsize=4)
+def _subtle_alpha_mask(size: Tuple[int, int]) -> Image.Image:
+    """
+    Uniform 20% alpha mask for an opaque background image of the given size.
+
+    Slides share the canvas size, so one mask serves every render instead of
+    a fresh full-canvas buffer per slide. The mask must not be modified.
+    """
+    return Image.new('L', size, _SUBTLE_ALPHA_LUT[255])
+
+
+# Shared HTTP session so placeholder downloads reuse keep-alive connections
+# instead of paying a TCP + TLS handshake per slide
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+
+@lru_cache(maxsize=64)
+def _fetch_image_bytes(url: str) -> bytes:
+    """
+    Download raw image bytes, once per URL per process.
+
+    Random placeholder URLs embed their seed, so slides sharing a seed reuse
+    one download. Failed requests raise and are therefore never cached.
+    """
+    response = _SESSION.get(url, timeout=10)
+    response.raise_for_status()
+    return response.content
+
+
+@lru_cache(maxsize=32)
+def _load_custom_image_cached(url: str, remove_bg: bool, bg_method: str,
+                              alpha_matting: bool, color_tolerance: int) -> Image.Image:
+    """
+    Load a custom hero image, applying background removal when requested.
+
+    Keyed by every option that affects the result, so slides reusing the same
+    hero skip both the decode and the (expensive) background removal. The
+    returned image is shared and must not be modified.
+    """
+    asset_manager = get_asset_manager()
+
+    # First load image without background removal to check transparency
+    image = asset_manager.load_asset(
+        url,
+        role='hero_image',
+        remove_bg=False,  # Load first to check transparency
+        bg_removal_method=bg_method,
+        use_cache=True
+    )
+
+    # Check if image already has transparency
+    if YuanPaymentCarouselLayout._has_transparency(image):
+        print(f"✅ Image already has transparent background, skipping removal: {url}")
+        return image
+
+    # If background removal is requested and image doesn't have transparency, apply it
+    if remove_bg:
+        print(f"🎨 Applying background removal to image: {url} (method: {bg_method})")
+        image = asset_manager.remove_background(
+            image,
+            method=bg_method,
+            alpha_matting=alpha_matting,
+            color_tolerance=color_tolerance
+        )
+        print(f"✅ Loaded custom image with background removal: {url}")
+    else:
+        print(f"✅ Loaded custom image: {url}")
+
+    return image
+
+
+@lru_cache(maxsize=16)
+def _get_sized_logo(url: str, size: int, remove_bg: bool, bg_method: str,
+                    alpha_matting: bool, color_tolerance: int) -> Image.Image:
+    """
+    Load a logo, remove its background if requested and resize it to size.
+
+    Every slide of a carousel shows the same logo at the same size, so the
+    load, background removal and LANCZOS resize run once. The returned image
+    is shared and must not be modified.
+    """
+    asset_manager = get_asset_manager()
+
+    # First load logo without background removal to check transparency
+    logo = asset_manager.load_asset(
+        url,
+        role='logo',
+        use_cache=True,
+        remove_bg=False  # Load first to check transparency
+    )
+
+    # Check if logo already has transparency
+    if YuanPaymentCarouselLayout._has_transparency(logo):
+        print(f"✅ Logo already has transparent background, skipping removal: {url}")
+    elif remove_bg:
+        # If background removal is requested and logo doesn't have transparency, apply it
+        print(f"🎨 Applying background removal to logo: {url} (method: {bg_method})")
+        logo = asset_manager.remove_background(
+            logo,
+            method=bg_method,
+            alpha_matting=alpha_matting,
+            color_tolerance=color_tolerance
+        )
+        print(f"✅ Logo background removed successfully")
+
+    logo_width = min(size, logo.width)
+    logo_aspect = logo.height / logo.width
+    logo_height = int(logo_width * logo_aspect)
+    return logo.resize((logo_width, logo_height), Image.Resampling.LANCZOS)
+
+
+# Named footer text colors
+_FOOTER_COLOR_MAP = {
+    'white': (255, 255, 255),
+    'black': (0, 0, 0),
+    'yellow': (255, 215, 0),
+    'red': (194, 0, 0)
+}
+
+
+def _normalize_color(value: Any, default: Tuple[int, int, int] = (255, 255, 255)) -> Tuple[int, ...]:
+    """
+    Normalize a color option (color name or RGB list/tuple) to a tuple.
+
+    Unknown color names fall back to default.
+    """
+    if isinstance(value, str):
+        return _FOOTER_COLOR_MAP.get(value.lower(), default)
+    if len(value) == 3:
+        return tuple(int(c) for c in value)
+    return tuple(value)
+
+
+@lru_cache(maxsize=64)
+def _icon_fs_path(icon_name: str) -> Optional[str]:
+    """
+    Path of a bundled Yuan Payment icon, or None if it is not shipped.
+
+    The assets folder does not change while the process runs, so each name is
+    checked on disk once instead of once per slide.
+    """
+    path = os.path.join(_YUAN_ASSETS_DIR, f'{icon_name}.png')
+    return path if os.path.exists(path) else None
+
+
+@lru_cache(maxsize=64)
+def _get_sized_icon(url_or_path: str, size: int) -> Image.Image:
+    """
+    Load an icon and resize it to a size x size square, once per URL and size.
+
+    Brand, supporting and yuan-symbol icons repeat on every slide at fixed
+    sizes, so the LANCZOS resize runs once. Raises ValueError if the icon
+    cannot be loaded. The returned image is shared and must not be modified.
+    """
+    icon = get_asset_manager().load_asset(url_or_path, role='icon', use_cache=True)
+    return icon.resize((size, size), Image.Resampling.LANCZOS)
+
+
+# Footer tile geometry relative to its top edge: separator line, then the
+# social handles text (the tile starts 50px above the footer area)
+_FOOTER_TILE_OFFSET = 50
+_FOOTER_LINE_Y = 5
+_FOOTER_TEXT_Y = 20
+
+
+@lru_cache(maxsize=16)
+def _footer_tile(social_text: str, font: ImageFont.ImageFont,
+                 color: Tuple[int, ...], canvas_width: int) -> Image.Image:
+    """
+    Render the footer separator line and social handles into an RGBA tile.
+
+    The footer is identical on every slide of a carousel, so it is shaped and
+    drawn once and then pasted with its own alpha, which gives the same pixels
+    as drawing on the slide directly. The tile must not be modified.
+    """
+    bbox = font.getbbox(social_text)
+    text_width = bbox[2] - bbox[0]
+    text_x = (canvas_width - text_width) // 2
+
+    tile = Image.new('RGBA', (canvas_width, _FOOTER_TEXT_Y + bbox[3] + 2), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(tile)
+    draw.line([(60, _FOOTER_LINE_Y), (canvas_width - 60, _FOOTER_LINE_Y)],
+              fill=(255, 215, 0), width=2)
+    draw.text((text_x, _FOOTER_TEXT_Y), social_text, font=font, fill=color)
+    return tile
+
+
+@lru_cache(maxsize=256)
+def _parse_rich_segments(text: str) -> Tuple[Tuple[str, Dict[str, Any]], ...]:
+    """
+    Split rich text into merged (text, styles) segments, memoized per string.
+
+    Titles and subtitles repeat across the slides of a carousel, and RTL text
+    reaches this parser already shaped (itself memoized in the base class), so
+    the same strings are parsed over and over. The returned style dicts are
+    shared; YuanPaymentCarouselLayout._parse_rich_text copies them.
+    """
+    segments = []
+    i = 0
+    
+    while i < len(text):
+        # Look for formatting tags
+        found_tag = False
+        
+        # Color tag: #color:value#text#
+        color_match = re.match(r'#color:([^#]+)#', text[i:])
+        if color_match:
+            color_value = color_match.group(1)
+            # Try to parse as RGB tuple or color name
+            try:
+                if ',' in color_value:
+                    # RGB tuple: "255,0,0"
+                    rgb = [int(x.strip()) for x in color_value.split(',')]
+                    color = tuple(rgb[:3])
+                else:
+                    # Color name
+                    color_map = {
+                        'red': (194, 0, 0),
+                        'yellow': (255, 216, 74),  # #FFD84A - better contrast
+                        'yellow_light': (255, 236, 112),  # #FFEC70 - lighter yellow
+                        'white': (255, 255, 255),
+                        'black': (0, 0, 0),
+                        'blue': (0, 123, 255),
+                        'green': (40, 167, 69)
+                    }
+                    color = color_map.get(color_value.lower(), (255, 255, 255))
+            except:
+                color = (255, 255, 255)
+            
+            # Find closing tag
+            end_pos = text.find('#', i + color_match.end())
+            if end_pos != -1:
+                tag_start = i + color_match.start()
+                tag_end = i + color_match.end()
+                close_pos = end_pos + 1
+                segment_text = text[tag_end:end_pos]
+                segments.append((segment_text, {'color': color}))
+                i = close_pos
+                found_tag = True
+        
+        # Size tag: #size:48#text#
+        if not found_tag:
+            size_match = re.match(r'#size:(\d+)#', text[i:])
+            if size_match:
+                size_value = int(size_match.group(1))
+                # Find closing tag
+                end_pos = text.find('#', i + size_match.end())
+                if end_pos != -1:
+                    tag_start = i + size_match.start()
+                    tag_end = i + size_match.end()
+                    close_pos = end_pos + 1
+                    segment_text = text[tag_end:end_pos]
+                    segments.append((segment_text, {'size': size_value}))
+                    i = close_pos
+                    found_tag = True
+        
+        # Bold italic: ***text***
+        if not found_tag:
+            bold_italic_match = re.match(r'\*\*\*(.+?)\*\*\*', text[i:])
+            if bold_italic_match:
+                segment_text = bold_italic_match.group(1)
+                segments.append((segment_text, {'bold': True, 'italic': True}))
+                i += bold_italic_match.end()
+                found_tag = True
+        
+        # Bold: **text** or __text__
+        if not found_tag:
+            bold_match = re.match(r'(\*\*|__)(.+?)\1', text[i:], re.DOTALL)
+            if bold_match:
+                # Check if it's actually bold italic (***)
+                if i + 3 < len(text) and text[i:i+3] == '***':
+                    # Skip, already handled
+                    pass
+                else:
+                    segment_text = bold_match.group(2)
+                    segments.append((segment_text, {'bold': True}))
+                    i += bold_match.end()
+                    found_tag = True
+        
+        # Italic: *text* or _text_ (but not ** or __)
+        if not found_tag:
+            # Make sure we're not matching bold markers
+            if i + 2 < len(text) and text[i:i+2] in ('**', '__'):
+                pass  # Skip, this is a bold marker
+            else:
+                italic_match = re.match(r'(\*|_)([^*_\s][^*_]*?)\1', text[i:])
+                if italic_match:
+                    segment_text = italic_match.group(2)
+                    segments.append((segment_text, {'italic': True}))
+                    i += italic_match.end()
+                    found_tag = True
+        
+        # No tag found, add character as plain text
+        if not found_tag:
+            segments.append((text[i], {}))
+            i += 1
+    
+    # Merge consecutive segments with same style
+    merged = []
+    if segments:
+        current_text = segments[0][0]
+        current_style = segments[0][1].copy()
+        
+        for text, style in segments[1:]:
+            if style == current_style:
+                current_text += text
+            else:
+                merged.append((current_text, current_style))
+                current_text = text
+                current_style = style.copy()
+        
+        merged.append((current_text, current_style))
+    
+    return tuple(merged) if merged else ((text, {}),)
+
+
 @register_layout
 class YuanPaymentCarouselLayout(CarouselLayoutEngine):
     """
@@ -109,29 +447,31 @@ class YuanPaymentCarouselLayout(CarouselLayoutEngine):
         self.canvas_width = 1080
         self.canvas_height = 1080
 
-        # Create base background
+        # Create base background; every helper below draws through this
+        # single ImageDraw and modifies the canvas in place
         canvas = self._create_background()
+        draw = ImageDraw.Draw(canvas)
 
         # Get layout style
         layout_style = self.options.get('layout_style', 'centered_portrait')
 
         # Add logo area (top)
-        canvas = self._add_logo_area(canvas)
+        canvas = self._add_logo_area(canvas, draw)
 
         # Render based on layout style
         if layout_style == 'centered_portrait':
-            canvas = self._render_centered_portrait(canvas)
+            canvas = self._render_centered_portrait(canvas, draw)
         elif layout_style == 'symbol_focus':
-            canvas = self._render_symbol_focus(canvas)
+            canvas = self._render_symbol_focus(canvas, draw)
         elif layout_style == 'product_layout':
-            canvas = self._render_product_layout(canvas)
+            canvas = self._render_product_layout(canvas, draw)
         elif layout_style == 'split_screen':
-            canvas = self._render_split_screen(canvas)
+            canvas = self._render_split_screen(canvas, draw)
         elif layout_style == 'gradient_background':
-            canvas = self._render_gradient_background(canvas)
+            canvas = self._render_gradient_background(canvas, draw)
         else:
             # Default to centered portrait
-            canvas = self._render_centered_portrait(canvas)
+            canvas = self._render_centered_portrait(canvas, draw)
 
         # Add brand footer (bottom)
         if self.options.get('show_brand_footer', True):
@@ -161,25 +501,8 @@ class YuanPaymentCarouselLayout(CarouselLayoutEngine):
         color1 = tuple(int(c) for c in colors[0])
         color2 = tuple(int(c) for c in colors[1]) if len(colors) > 1 else tuple([168, 0, 0])
         
-        img = Image.new('RGB', (self.canvas_width, self.canvas_height))
-        draw = ImageDraw.Draw(img)
-        
-        if direction == 'vertical':
-            for y in range(self.canvas_height):
-                ratio = y / self.canvas_height
-                r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-                g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-                b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-                draw.line([(0, y), (self.canvas_width, y)], fill=(r, g, b))
-        else:  # horizontal
-            for x in range(self.canvas_width):
-                ratio = x / self.canvas_width
-                r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-                g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-                b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-                draw.line([(x, 0), (x, self.canvas_height)], fill=(r, g, b))
-        
-        return img
+        # Vectorized in the base class: one line of colors stretched over the canvas
+        return self._render_linear_gradient(color1, color2, direction)
 
     def _create_image_background(self) -> Image.Image:
         """Create background from image with optional overlay."""
@@ -188,7 +511,6 @@ class YuanPaymentCarouselLayout(CarouselLayoutEngine):
             return self._create_background()  # Fallback to solid color
         
         try:
-            from src.asset_manager import get_asset_manager
             asset_manager = get_asset_manager()
             bg_image = asset_manager.load_asset(image_url, role='background', use_cache=True)
             
@@ -198,58 +520,35 @@ class YuanPaymentCarouselLayout(CarouselLayoutEngine):
             # Apply overlay if specified
             overlay_opacity = self.background.get('overlay_opacity', 0.0)
             if overlay_opacity > 0:
+                # Blend the color straight into the RGB pixels; no full-canvas
+                # RGBA layer or mode round-trip
                 overlay_color = tuple(self.background.get('overlay_color', [194, 0, 0]))
-                overlay = Image.new('RGBA', (self.canvas_width, self.canvas_height), 
-                                  (*overlay_color, int(overlay_opacity * 255)))
-                bg_image = bg_image.convert('RGBA')
-                bg_image = Image.alpha_composite(bg_image, overlay)
-                return bg_image.convert('RGB')
+                return self._blend_color_overlay(bg_image, overlay_color, overlay_opacity)
             
+            if bg_image.mode == 'RGB':
+                return bg_image
             return bg_image.convert('RGB')
         except Exception as e:
             print(f"⚠️ Warning: Could not load background image: {e}")
             return self._create_background()
 
-    def _add_logo_area(self, canvas: Image.Image) -> Image.Image:
+    def _add_logo_area(self, canvas: Image.Image,
+                       draw: Optional[ImageDraw.ImageDraw] = None) -> Image.Image:
         """Add logo area at top with optional slide number."""
         # Add logo if available
         logo_url = self.assets.get('logo_url', '')
         if self.options.get('show_logo', True) and logo_url and logo_url.strip():
             try:
-                from src.asset_manager import get_asset_manager
-                asset_manager = get_asset_manager()
-                # Add background removal support for logos
-                remove_logo_bg = self.options.get('remove_logo_background', False)
-                logo_bg_method = self.options.get('logo_bg_removal_method', 'auto')
-                
-                # First load logo without background removal to check transparency
-                logo = asset_manager.load_asset(
-                    logo_url.strip(), 
-                    role='logo', 
-                    use_cache=True,
-                    remove_bg=False  # Load first to check transparency
+                # Loaded, background-removed and resized once per URL and size
+                logo = _get_sized_logo(
+                    logo_url.strip(),
+                    self.options.get('logo_size', 120),  # Default to 120
+                    self.options.get('remove_logo_background', False),
+                    self.options.get('logo_bg_removal_method', 'auto'),
+                    self.options.get('alpha_matting', True),
+                    self.options.get('color_tolerance', 30)
                 )
-                
-                # Check if logo already has transparency
-                if self._has_transparency(logo):
-                    print(f"✅ Logo already has transparent background, skipping removal: {logo_url}")
-                elif remove_logo_bg:
-                    # If background removal is requested and logo doesn't have transparency, apply it
-                    print(f"🎨 Applying background removal to logo: {logo_url} (method: {logo_bg_method})")
-                    logo = asset_manager.remove_background(
-                        logo,
-                        method=logo_bg_method,
-                        alpha_matting=self.options.get('alpha_matting', True),
-                        color_tolerance=self.options.get('color_tolerance', 30)
-                    )
-                    print(f"✅ Logo background removed successfully")
-                
-                # Get logo size from options, default to 120
-                logo_size = self.options.get('logo_size', 120)
-                logo_width = min(logo_size, logo.width)
-                logo_aspect = logo.height / logo.width
-                logo_height = int(logo_width * logo_aspect)
-                logo = logo.resize((logo_width, logo_height), Image.Resampling.LANCZOS)
+                logo_width, logo_height = logo.size
                 
                 # Position based on options, default to top-left
                 logo_position = self.options.get('logo_position', 'top-left')
@@ -276,25 +575,26 @@ class YuanPaymentCarouselLayout(CarouselLayoutEngine):
         if self.options.get('show_slide_number', False):
             slide_num = self.options.get('slide_number', 1)
             total_slides = self.options.get('total_slides', 1)
-            canvas = self._add_slide_number(canvas, slide_num, total_slides, position='top-right')
+            canvas = self._add_slide_number(canvas, slide_num, total_slides, position='top-right',
+                                            draw=draw)
 
         return canvas
 
     def _add_slide_number(self, canvas: Image.Image, slide_num: int, 
-                         total_slides: int, position: str = 'top-right') -> Image.Image:
+                         total_slides: int, position: str = 'top-right',
+                         draw: Optional[ImageDraw.ImageDraw] = None) -> Image.Image:
         """Add slide number indicator."""
-        draw = ImageDraw.Draw(canvas)
+        if draw is None:
+            draw = ImageDraw.Draw(canvas)
         
         # Create slide number text
         text = f"{slide_num}/{total_slides}"
         
         # Get font
         try:
-            font_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-                                   'assets', 'fonts')
-            font_path = os.path.join(font_dir, 'NotoSans-Bold.ttf')
-            font = ImageFont.truetype(font_path, 32)
-        except:
+            font_path = _FONT_LATIN_BOLD
+            font = load_font(font_path, 32)
+        except OSError:
             font = ImageFont.load_default()
         
         # Calculate position
@@ -317,12 +617,17 @@ class YuanPaymentCarouselLayout(CarouselLayoutEngine):
             x_pos + text_width + padding,
             y_pos + text_height + padding
         ]
-        # Create semi-transparent background
-        overlay = Image.new('RGBA', (self.canvas_width, self.canvas_height), (0, 0, 0, 0))
-        overlay_draw = ImageDraw.Draw(overlay)
-        overlay_draw.rounded_rectangle(bg_rect, fill=(0, 0, 0, 180), radius=8)
-        canvas = Image.alpha_composite(canvas.convert('RGBA'), overlay).convert('RGB')
-        draw = ImageDraw.Draw(canvas)
+        # Create semi-transparent background on a badge-sized tile and blend
+        # only that region; the rectangle includes its end coordinates
+        box = (bg_rect[0], bg_rect[1], bg_rect[2] + 1, bg_rect[3] + 1)
+        tile = Image.new('RGBA', (box[2] - box[0], box[3] - box[1]), (0, 0, 0, 0))
+        ImageDraw.Draw(tile).rounded_rectangle(
+            [0, 0, bg_rect[2] - bg_rect[0], bg_rect[3] - bg_rect[1]],
+            fill=(0, 0, 0, 180), radius=8
+        )
+        region = canvas.crop(box).convert('RGBA')
+        region.alpha_composite(tile)
+        canvas.paste(region.convert('RGB'), box[:2])
         
         # Draw text (white)
         draw.text((x_pos, y_pos), text, font=font, fill=(255, 255, 255))
@@ -339,10 +644,11 @@ class YuanPaymentCarouselLayout(CarouselLayoutEngine):
         else:
             return self._load_random_image()
 
-    def _has_transparency(self, image: Image.Image) -> bool:
+    @staticmethod
+    def _has_transparency(image: Image.Image) -> bool:
         """Check if image already has transparency/alpha channel."""
         if image.mode == 'RGBA':
-            alpha_channel = image.split()[-1]
+            alpha_channel = image.getchannel('A')
             # Check if alpha channel has any transparent pixels
             alpha_min, alpha_max = alpha_channel.getextrema()
             # If min alpha is less than 255, image has some transparency
@@ -376,161 +682,23 @@ class YuanPaymentCarouselLayout(CarouselLayoutEngine):
         if not enable_rich_text:
             return [(text, {})]
         
-        segments = []
-        i = 0
-        
-        while i < len(text):
-            # Look for formatting tags
-            found_tag = False
-            
-            # Color tag: #color:value#text#
-            color_match = re.match(r'#color:([^#]+)#', text[i:])
-            if color_match:
-                color_value = color_match.group(1)
-                # Try to parse as RGB tuple or color name
-                try:
-                    if ',' in color_value:
-                        # RGB tuple: "255,0,0"
-                        rgb = [int(x.strip()) for x in color_value.split(',')]
-                        color = tuple(rgb[:3])
-                    else:
-                        # Color name
-                        color_map = {
-                            'red': (194, 0, 0),
-                            'yellow': (255, 216, 74),  # #FFD84A - better contrast
-                            'yellow_light': (255, 236, 112),  # #FFEC70 - lighter yellow
-                            'white': (255, 255, 255),
-                            'black': (0, 0, 0),
-                            'blue': (0, 123, 255),
-                            'green': (40, 167, 69)
-                        }
-                        color = color_map.get(color_value.lower(), (255, 255, 255))
-                except:
-                    color = (255, 255, 255)
-                
-                # Find closing tag
-                end_pos = text.find('#', i + color_match.end())
-                if end_pos != -1:
-                    tag_start = i + color_match.start()
-                    tag_end = i + color_match.end()
-                    close_pos = end_pos + 1
-                    segment_text = text[tag_end:end_pos]
-                    segments.append((segment_text, {'color': color}))
-                    i = close_pos
-                    found_tag = True
-            
-            # Size tag: #size:48#text#
-            if not found_tag:
-                size_match = re.match(r'#size:(\d+)#', text[i:])
-                if size_match:
-                    size_value = int(size_match.group(1))
-                    # Find closing tag
-                    end_pos = text.find('#', i + size_match.end())
-                    if end_pos != -1:
-                        tag_start = i + size_match.start()
-                        tag_end = i + size_match.end()
-                        close_pos = end_pos + 1
-                        segment_text = text[tag_end:end_pos]
-                        segments.append((segment_text, {'size': size_value}))
-                        i = close_pos
-                        found_tag = True
-            
-            # Bold italic: ***text***
-            if not found_tag:
-                bold_italic_match = re.match(r'\*\*\*(.+?)\*\*\*', text[i:])
-                if bold_italic_match:
-                    segment_text = bold_italic_match.group(1)
-                    segments.append((segment_text, {'bold': True, 'italic': True}))
-                    i += bold_italic_match.end()
-                    found_tag = True
-            
-            # Bold: **text** or __text__
-            if not found_tag:
-                bold_match = re.match(r'(\*\*|__)(.+?)\1', text[i:], re.DOTALL)
-                if bold_match:
-                    # Check if it's actually bold italic (***)
-                    if i + 3 < len(text) and text[i:i+3] == '***':
-                        # Skip, already handled
-                        pass
-                    else:
-                        segment_text = bold_match.group(2)
-                        segments.append((segment_text, {'bold': True}))
-                        i += bold_match.end()
-                        found_tag = True
-            
-            # Italic: *text* or _text_ (but not ** or __)
-            if not found_tag:
-                # Make sure we're not matching bold markers
-                if i + 2 < len(text) and text[i:i+2] in ('**', '__'):
-                    pass  # Skip, this is a bold marker
-                else:
-                    italic_match = re.match(r'(\*|_)([^*_\s][^*_]*?)\1', text[i:])
-                    if italic_match:
-                        segment_text = italic_match.group(2)
-                        segments.append((segment_text, {'italic': True}))
-                        i += italic_match.end()
-                        found_tag = True
-            
-            # No tag found, add character as plain text
-            if not found_tag:
-                segments.append((text[i], {}))
-                i += 1
-        
-        # Merge consecutive segments with same style
-        merged = []
-        if segments:
-            current_text = segments[0][0]
-            current_style = segments[0][1].copy()
-            
-            for text, style in segments[1:]:
-                if style == current_style:
-                    current_text += text
-                else:
-                    merged.append((current_text, current_style))
-                    current_text = text
-                    current_style = style.copy()
-            
-            merged.append((current_text, current_style))
-        
-        return merged if merged else [(text, {})]
+        # Parsing walks the string a character at a time; the result is cached
+        # per string, so hand out fresh style dicts to keep the cache intact
+        return [(segment_text, dict(style)) for segment_text, style in _parse_rich_segments(text)]
 
     def _load_custom_image(self, url: str) -> Optional[Image.Image]:
         """Load custom uploaded image with background removal support."""
         try:
-            from src.asset_manager import get_asset_manager
-            asset_manager = get_asset_manager()
             # Read background removal options with proper defaults
-            remove_bg = self.options.get('remove_hero_background', False)
-            bg_method = self.options.get('bg_removal_method', 'auto')
-            
-            # First load image without background removal to check transparency
-            image = asset_manager.load_asset(
+            image = _load_custom_image_cached(
                 url,
-                role='hero_image',
-                remove_bg=False,  # Load first to check transparency
-                bg_removal_method=bg_method,
-                use_cache=True
+                self.options.get('remove_hero_background', False),
+                self.options.get('bg_removal_method', 'auto'),
+                self.options.get('alpha_matting', True),
+                self.options.get('color_tolerance', 30)
             )
-            
-            # Check if image already has transparency
-            if self._has_transparency(image):
-                print(f"✅ Image already has transparent background, skipping removal: {url}")
-                return image
-            
-            # If background removal is requested and image doesn't have transparency, apply it
-            if remove_bg:
-                print(f"🎨 Applying background removal to image: {url} (method: {bg_method})")
-                image = asset_manager.remove_background(
-                    image,
-                    method=bg_method,
-                    alpha_matting=self.options.get('alpha_matting', True),
-                    color_tolerance=self.options.get('color_tolerance', 30)
-                )
-                print(f"✅ Loaded custom image with background removal: {url}")
-            else:
-                print(f"✅ Loaded custom image: {url}")
-            
-            return image
+            # The cached image is shared between renders
+            return image.copy()
         except Exception as e:
             print(f"⚠️ Warning: Could not load custom image {url}: {e}")
             return None
@@ -548,11 +716,8 @@ class YuanPaymentCarouselLayout(CarouselLayoutEngine):
             
             print(f"🖼️  Loading random image from picsum.photos (seed: {seed})")
             
-            response = requests.get(url, timeout=10, stream=True)
-            response.raise_for_status()
-            
-            image_data = BytesIO(response.content)
-            image = Image.open(image_data)
+            # Raw bytes are cached per URL; decode a fresh image each time
+            image = Image.open(BytesIO(_fetch_image_bytes(url)))
             
             if image.mode not in ('RGB', 'RGBA'):
                 image = image.convert('RGB')
@@ -565,8 +730,9 @@ class YuanPaymentCarouselLayout(CarouselLayoutEngine):
             return None
 
     def _fit_image(self, image: Image.Image, target_width: int, 
-                   target_height: int, mode: str = 'cover') -> Image.Image:
-        """Fit image to target dimensions."""
+                   target_height: int, mode: str = 'cover',
+                   resample: Image.Resampling = Image.Resampling.LANCZOS) -> Image.Image:
+        """Fit image to target dimensions using the given resampling filter."""
         img_width, img_height = image.size
         target_ratio = target_width / target_height
         img_ratio = img_width / img_height
@@ -582,7 +748,7 @@ class YuanPaymentCarouselLayout(CarouselLayoutEngine):
                 new_width = target_width
                 new_height = int(new_width / img_ratio)
             
-            resized = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+            resized = image.resize((new_width, new_height), resample)
             
             # Crop to target size (center)
             left = (new_width - target_width) // 2
@@ -600,12 +766,13 @@ class YuanPaymentCarouselLayout(CarouselLayoutEngine):
             new_width = int(img_width * ratio)
             new_height = int(img_height * ratio)
             
-            return image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+            return image.resize((new_width, new_height), resample)
 
-    def _render_centered_portrait(self, canvas: Image.Image) -> Image.Image:
+    def _render_centered_portrait(self, canvas: Image.Image,
+                              draw: Optional[ImageDraw.ImageDraw] = None) -> Image.Image:
         """Render centered portrait layout with proportional spacing."""
         # Add title at top with proper spacing (+40px padding = 120px total from top)
-        canvas = self._add_title_section(canvas, y_offset=120)
+        canvas = self._add_title_section(canvas, y_offset=120, draw=draw)
         
         # Add description under title (16-24px margin after title)
         description = self.content.get('description', '')
@@ -623,7 +790,8 @@ class YuanPaymentCarouselLayout(CarouselLayoutEngine):
                                         x=desc_x, 
                                         y=description_y, 
                                         max_width=max_width,
-                                        align=desc_align)
+                                        align=desc_align,
+                                        draw=draw)
             # Update description_y to actual end position for hero text positioning
             # We'll recalculate after drawing
         
@@ -682,7 +850,8 @@ class YuanPaymentCarouselLayout(CarouselLayoutEngine):
                 canvas = self._add_icon(canvas, 'checkmark', x_pos + img_size + 20, y_pos + 150)
         elif show_text and hero_text:
             # Add hero text instead of image
-            canvas = self._add_hero_text(canvas, hero_text, x_pos, y_pos, img_size, img_size)
+            canvas = self._add_hero_text(canvas, hero_text, x_pos, y_pos, img_size, img_size,
+                                         draw=draw)
         
         # Determine if we have hero content (image or text)
         has_hero = show_image or show_text
@@ -711,20 +880,20 @@ class YuanPaymentCarouselLayout(CarouselLayoutEngine):
                     subtitle_y = 700  # Below description area
                 else:
                     subtitle_y = 750
-            canvas = self._add_subtitle(canvas, subtitle, y_pos=subtitle_y)
+            canvas = self._add_subtitle(canvas, subtitle, y_pos=subtitle_y, draw=draw)
         
         return canvas
 
-    def _render_symbol_focus(self, canvas: Image.Image) -> Image.Image:
+    def _render_symbol_focus(self, canvas: Image.Image,
+                         draw: Optional[ImageDraw.ImageDraw] = None) -> Image.Image:
         """Render symbol focus layout."""
         # Add title at top
-        canvas = self._add_title_section(canvas, y_offset=100)
+        canvas = self._add_title_section(canvas, y_offset=100, draw=draw)
         
         # Draw large yuan symbol in center (or use icon if available)
-        yuan_symbol = self._get_yuan_symbol_image()
+        symbol_size = 400
+        yuan_symbol = self._get_yuan_symbol_image(symbol_size)
         if yuan_symbol:
-            symbol_size = 400
-            yuan_symbol = yuan_symbol.resize((symbol_size, symbol_size), Image.Resampling.LANCZOS)
             x_pos = (self.canvas_width - symbol_size) // 2
             y_pos = 350
             if yuan_symbol.mode == 'RGBA':
@@ -735,14 +904,15 @@ class YuanPaymentCarouselLayout(CarouselLayoutEngine):
         # Add text box at bottom
         body_text = self.content.get('body_text', '')
         if body_text:
-            canvas = self._add_content_box(canvas, body_text, y_pos=750)
+            canvas = self._add_content_box(canvas, body_text, y_pos=750, draw=draw)
         
         return canvas
 
-    def _render_product_layout(self, canvas: Image.Image) -> Image.Image:
+    def _render_product_layout(self, canvas: Image.Image,
+                           draw: Optional[ImageDraw.ImageDraw] = None) -> Image.Image:
         """Render product layout."""
         # Add title above products
-        canvas = self._add_title_section(canvas, y_offset=100)
+        canvas = self._add_title_section(canvas, y_offset=100, draw=draw)
         
         # Load and add product image
         main_image = self._load_main_image()
@@ -767,14 +937,15 @@ class YuanPaymentCarouselLayout(CarouselLayoutEngine):
         # Add bullet points below
         bullets = self.content.get('bullets', [])
         if bullets:
-            canvas = self._add_bullet_list(canvas, bullets, y_pos=y_pos + 420)
+            canvas = self._add_bullet_list(canvas, bullets, y_pos=y_pos + 420, draw=draw)
         
         return canvas
 
-    def _render_split_screen(self, canvas: Image.Image) -> Image.Image:
+    def _render_split_screen(self, canvas: Image.Image,
+                         draw: Optional[ImageDraw.ImageDraw] = None) -> Image.Image:
         """Render split screen layout."""
         # Add title at top
-        canvas = self._add_title_section(canvas, y_offset=100)
+        canvas = self._add_title_section(canvas, y_offset=100, draw=draw)
         
         # Split into two columns
         left_width = self.canvas_width // 2
@@ -800,40 +971,43 @@ class YuanPaymentCarouselLayout(CarouselLayoutEngine):
         max_width = right_width - 80
         
         if body_text:
-            canvas = self._add_text_block(canvas, body_text, text_x, text_y, max_width)
+            canvas = self._add_text_block(canvas, body_text, text_x, text_y, max_width, draw=draw)
             text_y += 150
         
         if bullets:
-            canvas = self._add_bullet_list(canvas, bullets, x=text_x, y=text_y, max_width=max_width)
+            canvas = self._add_bullet_list(canvas, bullets, x=text_x, y=text_y, max_width=max_width,
+                                           draw=draw)
         
         return canvas
 
-    def _render_gradient_background(self, canvas: Image.Image) -> Image.Image:
+    def _render_gradient_background(self, canvas: Image.Image,
+                                draw: Optional[ImageDraw.ImageDraw] = None) -> Image.Image:
         """Render gradient background layout."""
         # Create soft gradient background (already done in _create_background if mode is gradient)
+        # Optional: Add light image in background. It is blended into the
+        # canvas first (one masked paste) so the text is drawn on top of it
+        main_image = self._load_main_image()
+        if main_image:
+            # Use as subtle background; at 20% opacity LANCZOS quality is
+            # invisible, so use the much cheaper BILINEAR filter
+            bg_img = self._fit_image(main_image, self.canvas_width, self.canvas_height,
+                                     mode='cover', resample=Image.Resampling.BILINEAR)
+            # Make it very subtle: 20% opacity, scaled from any existing alpha
+            if bg_img.mode == 'RGBA':
+                alpha = bg_img.getchannel('A').point(_SUBTLE_ALPHA_LUT)
+            else:
+                alpha = _subtle_alpha_mask(bg_img.size)
+            if bg_img.mode != 'RGB':
+                bg_img = bg_img.convert('RGB')
+            canvas.paste(bg_img, (0, 0), alpha)
+        
         # Add title at top
-        canvas = self._add_title_section(canvas, y_offset=100)
+        canvas = self._add_title_section(canvas, y_offset=100, draw=draw)
         
         # Add bullet list in middle
         bullets = self.content.get('bullets', [])
         if bullets:
-            canvas = self._add_bullet_list(canvas, bullets, y_pos=400, max_width=800)
-        
-        # Optional: Add light image in background
-        main_image = self._load_main_image()
-        if main_image:
-            # Use as subtle background
-            bg_img = self._fit_image(main_image, self.canvas_width, self.canvas_height, mode='cover')
-            # Make it very subtle
-            bg_img = bg_img.convert('RGBA')
-            alpha = bg_img.split()[3]
-            alpha = alpha.point(lambda p: int(p * 0.2))  # 20% opacity
-            bg_img.putalpha(alpha)
-            
-            # Composite under everything
-            canvas_rgba = canvas.convert('RGBA')
-            canvas_rgba = Image.alpha_composite(bg_img, canvas_rgba)
-            canvas = canvas_rgba.convert('RGB')
+            canvas = self._add_bullet_list(canvas, bullets, y_pos=400, max_width=800, draw=draw)
         
         return canvas
 
@@ -868,37 +1042,35 @@ class YuanPaymentCarouselLayout(CarouselLayoutEngine):
                             bold: bool = False, italic: bool = False) -> ImageFont.ImageFont:
         """Get font with style (bold/italic)."""
         try:
-            font_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-                                   'assets', 'fonts')
-            
             if is_rtl:
                 if bold and italic:
-                    font_path = os.path.join(font_dir, 'IRANYekanBoldFaNum.ttf')  # Closest to bold italic
+                    font_path = _FONT_RTL_BOLD  # Closest to bold italic
                 elif bold:
-                    font_path = os.path.join(font_dir, 'IRANYekanBoldFaNum.ttf')
+                    font_path = _FONT_RTL_BOLD
                 elif italic:
-                    font_path = os.path.join(font_dir, 'IRANYekanMediumFaNum.ttf')  # Closest to italic
+                    font_path = _FONT_RTL_MEDIUM  # Closest to italic
                 else:
-                    font_path = os.path.join(font_dir, 'IRANYekanRegularFaNum.ttf')
+                    font_path = _FONT_RTL_REGULAR
             else:
                 if bold and italic:
                     # Use bold as closest approximation
-                    font_path = os.path.join(font_dir, 'NotoSans-Bold.ttf')
+                    font_path = _FONT_LATIN_BOLD
                 elif bold:
-                    font_path = os.path.join(font_dir, 'NotoSans-Bold.ttf')
+                    font_path = _FONT_LATIN_BOLD
                 elif italic:
                     # PIL doesn't have italic NotoSans, use regular
-                    font_path = os.path.join(font_dir, 'NotoSans-Regular.ttf')
+                    font_path = _FONT_LATIN_REGULAR
                 else:
-                    font_path = os.path.join(font_dir, 'NotoSans-Regular.ttf')
+                    font_path = _FONT_LATIN_REGULAR
             
-            return ImageFont.truetype(font_path, font_size)
-        except:
+            return load_font(font_path, font_size)
+        except OSError:
             return ImageFont.load_default()
 
     def _draw_rich_text(self, canvas: Image.Image, text: str, x: int, y: int, 
                        max_width: int, base_font_size: int, base_color: Tuple[int, int, int],
-                       is_rtl: bool, align: str = 'center') -> int:
+                       is_rtl: bool, align: str = 'center',
+                       draw: Optional[ImageDraw.ImageDraw] = None) -> int:
         """
         Draw rich text with formatting.
         
@@ -912,11 +1084,13 @@ class YuanPaymentCarouselLayout(CarouselLayoutEngine):
             base_color: Base text color
             is_rtl: Whether text is right-to-left
             align: Text alignment ('left', 'center', 'right', 'justify')
+            draw: Optional existing ImageDraw for canvas (created if omitted)
             
         Returns:
             Final y position after drawing
         """
-        draw = ImageDraw.Draw(canvas)
+        if draw is None:
+            draw = ImageDraw.Draw(canvas)
         
         # For RTL text, prepare the entire text first to preserve word order
         # This ensures BiDi algorithm processes the full context correctly
@@ -942,13 +1116,12 @@ class YuanPaymentCarouselLayout(CarouselLayoutEngine):
             italic = style.get('italic', False)
             font = self._get_font_with_style('', font_size, is_rtl, bold, italic)
             
-            # Simple word wrapping (can be improved)
+            # Simple word wrapping (can be improved); only advance widths are
+            # needed, so measure with getlength (no ink bbox computation)
             words = segment_text.split() if segment_text else ['']
             for word in words:
                 if word:
-                    test_text = word + ' '
-                    bbox = font.getbbox(test_text)
-                    word_width = bbox[2] - bbox[0]
+                    word_width = int(font.getlength(word + ' '))
                     
                     if current_line_width + word_width <= max_width:
                         current_line.append((word + ' ', style))
@@ -960,8 +1133,7 @@ class YuanPaymentCarouselLayout(CarouselLayoutEngine):
                         current_line_width = word_width
                 else:
                     # Space
-                    bbox = font.getbbox(' ')
-                    space_width = bbox[2] - bbox[0]
+                    space_width = int(font.getlength(' '))
                     if current_line_width + space_width <= max_width:
                         current_line.append((' ', style))
                         current_line_width += space_width
@@ -992,6 +1164,8 @@ class YuanPaymentCarouselLayout(CarouselLayoutEngine):
                 if not is_rtl and self._is_rtl_text(segment_text):
                     segment_text = self._prepare_arabic_text(segment_text)
                 
+                # Alignment and segment placement use the ink width, as
+                # before; getlength is only for the wrap-fit checks above
                 bbox = font.getbbox(segment_text)
                 seg_width = bbox[2] - bbox[0]
                 line_width += seg_width
@@ -1052,7 +1226,8 @@ class YuanPaymentCarouselLayout(CarouselLayoutEngine):
         return current_y
 
     def _add_hero_text(self, canvas: Image.Image, hero_text: str, x: int, y: int, 
-                      width: int, height: int) -> Image.Image:
+                      width: int, height: int,
+                      draw: Optional[ImageDraw.ImageDraw] = None) -> Image.Image:
         """
         Add hero text in the hero image area.
         
@@ -1063,6 +1238,7 @@ class YuanPaymentCarouselLayout(CarouselLayoutEngine):
             y: Top position of hero area
             width: Width of hero area
             height: Height of hero area
+            draw: Optional existing ImageDraw for canvas
         """
         # Get alignment option
         align = self.options.get('hero_text_align', 'center')
@@ -1096,12 +1272,13 @@ class YuanPaymentCarouselLayout(CarouselLayoutEngine):
         
         self._draw_rich_text(
             canvas, hero_text, text_x, text_y, max_width,
-            hero_text_size, hero_text_color, is_rtl, align
+            hero_text_size, hero_text_color, is_rtl, align, draw
         )
         
         return canvas
 
-    def _add_title_section(self, canvas: Image.Image, y_offset: int = 120) -> Image.Image:
+    def _add_title_section(self, canvas: Image.Image, y_offset: int = 120,
+                           draw: Optional[ImageDraw.ImageDraw] = None) -> Image.Image:
         """Add title text at top with rich text and alignment support."""
         title = self.content.get('title', '')
         if not title:
@@ -1128,12 +1305,13 @@ class YuanPaymentCarouselLayout(CarouselLayoutEngine):
         
         final_y = self._draw_rich_text(
             canvas, title, text_x, y_offset, max_width,
-            font_size, title_color, is_rtl, align
+            font_size, title_color, is_rtl, align, draw
         )
         
         return canvas
 
-    def _add_subtitle(self, canvas: Image.Image, subtitle: str, y_pos: int = 850) -> Image.Image:
+    def _add_subtitle(self, canvas: Image.Image, subtitle: str, y_pos: int = 850,
+                      draw: Optional[ImageDraw.ImageDraw] = None) -> Image.Image:
         """Add subtitle text with rich text and alignment support."""
         if not subtitle:
             return canvas
@@ -1158,14 +1336,16 @@ class YuanPaymentCarouselLayout(CarouselLayoutEngine):
         
         self._draw_rich_text(
             canvas, subtitle, text_x, y_pos, max_width,
-            font_size, subtitle_color, is_rtl, align
+            font_size, subtitle_color, is_rtl, align, draw
         )
         
         return canvas
 
-    def _add_content_box(self, canvas: Image.Image, text: str, y_pos: int = 750) -> Image.Image:
+    def _add_content_box(self, canvas: Image.Image, text: str, y_pos: int = 750,
+                         draw: Optional[ImageDraw.ImageDraw] = None) -> Image.Image:
         """Add content box with rounded rectangle."""
-        draw = ImageDraw.Draw(canvas)
+        if draw is None:
+            draw = ImageDraw.Draw(canvas)
         
         # Box dimensions
         box_width = self.canvas_width - 120
@@ -1185,36 +1365,35 @@ class YuanPaymentCarouselLayout(CarouselLayoutEngine):
         is_rtl = self._is_rtl_text(text)
         font_size = 28
         try:
-            font_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-                                   'assets', 'fonts')
             if is_rtl:
-                font_path = os.path.join(font_dir, 'IRANYekanRegularFaNum.ttf')
+                font_path = _FONT_RTL_REGULAR
             else:
-                font_path = os.path.join(font_dir, 'NotoSans-Regular.ttf')
-            font = ImageFont.truetype(font_path, font_size)
-        except:
+                font_path = _FONT_LATIN_REGULAR
+            font = load_font(font_path, font_size)
+        except OSError:
             font = ImageFont.load_default()
         
-        if is_rtl:
-            text = self._prepare_arabic_text(text)
-        
         text_color = self._get_text_color([73, 80, 87], 'body_text')
         
-        # Wrap text for box
-        lines = self._wrap_text(text, font, box_width - 40)
+        # Wrap text for box, then shape each line if RTL (memoized per text,
+        # font and width, so repeated slides skip both steps)
+        lines = self._shape_and_wrap(text, font, box_width - 40, is_rtl)
         
         text_x = box_x + 20
         text_y = box_y + 20
+        # Constant line pitch from the font metrics; multiline_text takes it as
+        # the extra spacing on top of the height of 'A'
+        line_pitch = self._get_line_height(font) + 10
+        spacing = line_pitch - font.getbbox('A')[3]
         
-        for line in lines:
-            draw.text((text_x, text_y), line, font=font, fill=text_color)
-            bbox = font.getbbox(line)
-            text_y += bbox[3] - bbox[1] + 10
+        draw.multiline_text((text_x, text_y), '\n'.join(lines), font=font,
+                            fill=text_color, spacing=spacing)
         
         return canvas
 
     def _add_text_block(self, canvas: Image.Image, text: str, x: int, y: int, 
-                       max_width: int, align: str = 'center') -> Image.Image:
+                       max_width: int, align: str = 'center',
+                       draw: Optional[ImageDraw.ImageDraw] = None) -> Image.Image:
         """Add text block at specific position with rich text and alignment support."""
         if not text:
             return canvas
@@ -1230,14 +1409,15 @@ class YuanPaymentCarouselLayout(CarouselLayoutEngine):
         
         self._draw_rich_text(
             canvas, text, x, y, max_width,
-            font_size, text_color, is_rtl, align
+            font_size, text_color, is_rtl, align, draw
         )
         
         return canvas
 
     def _add_bullet_list(self, canvas: Image.Image, bullets: List[str], 
                         x: int = None, y: int = None, max_width: int = None, 
-                        y_pos: int = None) -> Image.Image:
+                        y_pos: int = None,
+                        draw: Optional[ImageDraw.ImageDraw] = None) -> Image.Image:
         """Add bullet point list."""
         if x is None:
             x = 100
@@ -1246,44 +1426,51 @@ class YuanPaymentCarouselLayout(CarouselLayoutEngine):
         if max_width is None:
             max_width = self.canvas_width - 200
         
-        draw = ImageDraw.Draw(canvas)
+        if draw is None:
+            draw = ImageDraw.Draw(canvas)
         
-        is_rtl = any(self._is_rtl_text(bullet) for bullet in bullets)
+        # Scan each bullet for RTL characters once; the flags pick both the
+        # list's font and which bullets need shaping
+        rtl_flags = [self._is_rtl_text(bullet) for bullet in bullets]
+        is_rtl = any(rtl_flags)
         font_size = 28
         try:
-            font_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-                                   'assets', 'fonts')
             if is_rtl:
-                font_path = os.path.join(font_dir, 'IRANYekanRegularFaNum.ttf')
+                font_path = _FONT_RTL_REGULAR
             else:
-                font_path = os.path.join(font_dir, 'NotoSans-Regular.ttf')
-            font = ImageFont.truetype(font_path, font_size)
-        except:
+                font_path = _FONT_LATIN_REGULAR
+            font = load_font(font_path, font_size)
+        except OSError:
             font = ImageFont.load_default()
         
         bullet_color = self._get_text_color([255, 255, 255], 'body_text')
         bullet_size = 12
         bullet_spacing = 20
         
-        current_y = y
-        for bullet_text in bullets:
-            if is_rtl and self._is_rtl_text(bullet_text):
+        # Shape and measure every bullet in one pass, then draw
+        rows = []
+        for bullet_text, bullet_is_rtl in zip(bullets, rtl_flags):
+            if bullet_is_rtl:
                 display_text = self._prepare_arabic_text(bullet_text)
             else:
                 display_text = bullet_text
             
             bbox = font.getbbox(display_text)
-            text_height = bbox[3] - bbox[1]
+            rows.append((display_text, bbox[3] - bbox[1]))
+        
+        # Bullet and text columns only depend on the list direction
+        if is_rtl:
+            bullet_x = x + max_width - bullet_size
+            text_x = x
+        else:
+            bullet_x = x
+            text_x = x + bullet_size + bullet_spacing
+        
+        current_y = y
+        for display_text, text_height in rows:
             bullet_center_y = current_y + text_height // 2
             
             # Draw bullet circle
-            if is_rtl:
-                bullet_x = x + max_width - bullet_size
-                text_x = x
-            else:
-                bullet_x = x
-                text_x = x + bullet_size + bullet_spacing
-            
             draw.ellipse(
                 [bullet_x, bullet_center_y - bullet_size//2, 
                  bullet_x + bullet_size, bullet_center_y + bullet_size//2],
@@ -1299,27 +1486,17 @@ class YuanPaymentCarouselLayout(CarouselLayoutEngine):
 
     def _add_brand_footer(self, canvas: Image.Image) -> Image.Image:
         """Add brand footer at bottom with pagoda + yuan symbol."""
-        draw = ImageDraw.Draw(canvas)
-        
         footer_height = 100
         footer_y = self.canvas_height - footer_height
         
-        # Draw decorative separator line - moved up 40px
-        line_y = footer_y - 45  # Moved up from footer_y - 5 to footer_y - 45
-        draw.line([(60, line_y), (self.canvas_width - 60, line_y)], fill=(255, 215, 0), width=2)
-        
         # Add brand icon if available (pagoda + yuan symbol)
         icon_urls = self.assets.get('icon_urls', {})
         brand_icon_url = icon_urls.get('pagoda_yuan', None) or icon_urls.get('brand_icon', None)
         
         if brand_icon_url:
             try:
-                from src.asset_manager import get_asset_manager
-                asset_manager = get_asset_manager()
-                brand_icon = asset_manager.load_asset(brand_icon_url, role='icon', use_cache=True)
-                
                 icon_size = 60
-                brand_icon = brand_icon.resize((icon_size, icon_size), Image.Resampling.LANCZOS)
+                brand_icon = _get_sized_icon(brand_icon_url, icon_size)
                 icon_x = (self.canvas_width - icon_size) // 2
                 icon_y = footer_y + 20
                 
@@ -1336,34 +1513,20 @@ class YuanPaymentCarouselLayout(CarouselLayoutEngine):
             social_text = "@yuanpayment  |  @yuan-payment"  # Default fallback
         
         try:
-            font_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-                                   'assets', 'fonts')
-            font_path = os.path.join(font_dir, 'NotoSans-Regular.ttf')
+            font_path = _FONT_LATIN_REGULAR
             font_size = self.options.get('footer_font_size', 27)  # Increased from 24 to 27 (between 26-28px)
-            font = ImageFont.truetype(font_path, font_size)
-        except:
+            font = load_font(font_path, font_size)
+        except OSError:
             font = ImageFont.load_default()
         
         # Get footer text color from options
-        footer_text_color = self.options.get('footer_text_color', (255, 255, 255))
-        if isinstance(footer_text_color, (list, tuple)) and len(footer_text_color) == 3:
-            footer_text_color = tuple(int(c) for c in footer_text_color)
-        elif isinstance(footer_text_color, str):
-            color_map = {
-                'white': (255, 255, 255),
-                'black': (0, 0, 0),
-                'yellow': (255, 215, 0),
-                'red': (194, 0, 0)
-            }
-            footer_text_color = color_map.get(footer_text_color.lower(), (255, 255, 255))
+        footer_text_color = _normalize_color(self.options.get('footer_text_color', (255, 255, 255)))
         
-        bbox = font.getbbox(social_text)
-        text_width = bbox[2] - bbox[0]
-        text_x = (self.canvas_width - text_width) // 2
-        # Reduce margin-bottom by 40px: footer_y + 10 becomes footer_y - 30 (moved up 40px)
-        text_y = footer_y - 30  # Moved up 40px from footer_y + 10
-        
-        draw.text((text_x, text_y), social_text, font=font, fill=footer_text_color)
+        # Decorative separator line at footer_y - 45 (moved up 40px) and the
+        # centered social handles at footer_y - 30 (moved up 40px), drawn once
+        # per carousel and pasted onto each slide
+        tile = _footer_tile(social_text, font, footer_text_color, self.canvas_width)
+        canvas.paste(tile, (0, footer_y - _FOOTER_TILE_OFFSET), tile)
         
         return canvas
 
@@ -1374,22 +1537,13 @@ class YuanPaymentCarouselLayout(CarouselLayoutEngine):
         
         if not icon_url:
             # Try to find in assets folder
-            icon_path = os.path.join(
-                os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-                'assets', 'yuan_payment', f'{icon_type}.png'
-            )
-            if os.path.exists(icon_path):
-                icon_url = icon_path
-            else:
+            icon_url = _icon_fs_path(icon_type)
+            if not icon_url:
                 return canvas  # No icon available
         
         try:
-            from src.asset_manager import get_asset_manager
-            asset_manager = get_asset_manager()
-            icon = asset_manager.load_asset(icon_url, role='icon', use_cache=True)
-            
             icon_size = 80
-            icon = icon.resize((icon_size, icon_size), Image.Resampling.LANCZOS)
+            icon = _get_sized_icon(icon_url, icon_size)
             
             if icon.mode == 'RGBA':
                 canvas.paste(icon, (x, y), icon)
@@ -1400,27 +1554,22 @@ class YuanPaymentCarouselLayout(CarouselLayoutEngine):
         
         return canvas
 
-    def _get_yuan_symbol_image(self) -> Optional[Image.Image]:
-        """Get yuan symbol image for symbol focus layout."""
+    def _get_yuan_symbol_image(self, size: int) -> Optional[Image.Image]:
+        """Get yuan symbol image for symbol focus layout, resized to size x size."""
         icon_urls = self.assets.get('icon_urls', {})
         yuan_symbol_url = icon_urls.get('yuan_symbol', None)
         
         if yuan_symbol_url:
             try:
-                from src.asset_manager import get_asset_manager
-                asset_manager = get_asset_manager()
-                return asset_manager.load_asset(yuan_symbol_url, role='icon', use_cache=True)
+                return _get_sized_icon(yuan_symbol_url, size)
             except:
                 pass
         
         # Try assets folder
-        yuan_symbol_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-            'assets', 'yuan_payment', 'yuan-symbol.png'
-        )
-        if os.path.exists(yuan_symbol_path):
+        yuan_symbol_path = _icon_fs_path('yuan-symbol')
+        if yuan_symbol_path:
             try:
-                return Image.open(yuan_symbol_path)
+                return _get_sized_icon(yuan_symbol_path, size)
             except:
                 pass
         
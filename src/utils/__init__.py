@@ -5,6 +5,7 @@ This package contains helper functions for:
 - Color manipulation and contrast checking
 - Text processing and language detection
 - Font selection
+- Timing of named render sections (see profiling)
 """
 
 from .color_utils import (
@@ -3,10 +3,32 @@ Font Manager - Automatically download and manage fonts for any language
 """
 import os
 import requests
+from functools import lru_cache
 from pathlib import Path
 from PIL import ImageFont
 import sys
 
+
+@lru_cache(maxsize=64)
+def load_font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    """
+    Load a TrueType font, memoized by (path, size).
+
+    Parsing a TTF file is repeated for every render otherwise; the returned
+    font objects are read-only for drawing purposes and safe to share.
+
+    Args:
+        path: Path to the .ttf file
+        size: Font size in pixels
+
+    Returns:
+        PIL FreeTypeFont object
+
+    Raises:
+        OSError: If the font file cannot be opened
+    """
+    return ImageFont.truetype(path, size)
+
 class FontManager:
     """
     Manages font downloads and caching for multilingual support.
@@ -233,7 +255,7 @@ class FontManager:
             
             if font_path and os.path.exists(font_path):
                 try:
-                    return ImageFont.truetype(font_path, size)
+                    return load_font(font_path, size)
                 except:
                     continue
         
@@ -0,0 +1,70 @@
+"""
+Profiling Utilities - Lightweight timing of named render sections
+
+Layouts wrap their text path (shaping, wrapping, glyph drawing) and image path
+(fetch, resample, paste) in named sections, so a batch run shows which of the
+two dominates before picking the next optimization.
+
+Timings are accumulated in-process per section name. The overhead is two
+perf_counter calls and a dict update per section, so sections can stay in
+place in production.
+"""
+
+from contextlib import contextmanager
+from typing import Dict, Iterator
+import logging
+import threading
+import time
+
+
+logger = logging.getLogger(__name__)
+
+# Accumulated timings per section name; sections may run on worker threads
+_stats_lock = threading.Lock()
+_stats: Dict[str, Dict[str, float]] = {}
+
+
+@contextmanager
+def section(name: str) -> Iterator[None]:
+    """
+    Time a block of code under the given section name.
+
+    Works as a context manager (``with section('layout.text'):``) and as a
+    function decorator (``@section('layout.text')``).
+
+    Args:
+        name: Section name, by convention '<layout_type>.<path>'
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        with _stats_lock:
+            entry = _stats.get(name)
+            if entry is None:
+                entry = _stats[name] = {'count': 0, 'total': 0.0, 'max': 0.0}
+            entry['count'] += 1
+            entry['total'] += elapsed
+            entry['max'] = max(entry['max'], elapsed)
+        logger.debug("%s took %.2f ms", name, elapsed * 1000)
+
+
+def get_section_stats() -> Dict[str, Dict[str, float]]:
+    """
+    Get accumulated timings for every section seen so far.
+
+    Returns:
+        Dict mapping section name to count, total, mean and max (seconds)
+    """
+    with _stats_lock:
+        return {
+            name: dict(entry, mean=entry['total'] / entry['count'])
+            for name, entry in _stats.items()
+        }
+
+
+def reset_section_stats() -> None:
+    """Clear all accumulated section timings."""
+    with _stats_lock:
+        _stats.clear()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Compositing Regression Test
+
+Checks that LayoutEngine._composite_over (used by product_showcase to paste
+cut-out products) blends a semi-transparent RGBA overlay the same way as
+Pillow's Image.alpha_composite:
+1. Onto an RGB canvas (integer NumPy / numba path)
+2. Onto an RGBA canvas (Pillow path)
+3. With the overlay partly outside the canvas
+4. Through ProductShowcaseLayout._paste_product
+
+Usage:
+    python test_compositing.py
+"""
+
+import numpy as np
+from PIL import Image
+
+from src.layouts.product_showcase import ProductShowcaseLayout
+
+
+def make_overlay(size=(120, 90), seed=7):
+    """Create a noisy RGBA overlay covering the full 0-255 alpha range."""
+    rng = np.random.default_rng(seed)
+    data = rng.integers(0, 256, size=(size[1], size[0], 4), dtype=np.uint8)
+    data[:10, :, 3] = 0      # Fully transparent rows
+    data[-10:, :, 3] = 255   # Fully opaque rows
+    return Image.fromarray(data, 'RGBA')
+
+
+def make_canvas(mode='RGB', size=(200, 160), seed=3):
+    """Create a noisy canvas to composite onto."""
+    rng = np.random.default_rng(seed)
+    channels = 4 if mode == 'RGBA' else 3
+    data = rng.integers(0, 256, size=(size[1], size[0], channels), dtype=np.uint8)
+    if mode == 'RGBA':
+        data[..., 3] = 255
+    return Image.fromarray(data, mode)
+
+
+def reference_composite(canvas, overlay, xy):
+    """Composite with Image.alpha_composite on an RGBA copy of the canvas."""
+    layer = Image.new('RGBA', canvas.size, (0, 0, 0, 0))
+    layer.paste(overlay, xy)
+    result = Image.alpha_composite(canvas.convert('RGBA'), layer)
+    return result.convert(canvas.mode)
+
+
+def max_difference(a, b):
+    """Largest per-channel difference between two images of the same mode."""
+    return int(np.abs(np.asarray(a, dtype=np.int16) - np.asarray(b, dtype=np.int16)).max())
+
+
+def make_layout():
+    """Create a layout instance to call the compositing helpers on."""
+    return ProductShowcaseLayout({'product_name': 'Test', 'price': '$10'},
+                                 {'hero_image_url': 'unused.png'})
+
+
+def check_composite(canvas_mode, xy):
+    """Composite onto a canvas and compare with the Pillow reference."""
+    overlay = make_overlay()
+    canvas = make_canvas(canvas_mode)
+    expected = reference_composite(canvas, overlay, xy)
+
+    make_layout()._composite_over(canvas, overlay, xy)
+
+    # Pillow rounds the blend slightly differently; allow one level of error
+    assert canvas.mode == canvas_mode
+    assert max_difference(canvas, expected) <= 1, f"{canvas_mode} at {xy} differs"
+
+
+def test_composite_rgb_canvas():
+    """Semi-transparent RGBA over an RGB canvas matches alpha_composite."""
+    check_composite('RGB', (30, 40))
+
+
+def test_composite_rgba_canvas():
+    """Semi-transparent RGBA over an RGBA canvas matches alpha_composite."""
+    check_composite('RGBA', (30, 40))
+
+
+def test_composite_clipped():
+    """Overlays hanging off any edge only touch the covered region."""
+    for xy in [(-50, -30), (140, 120), (-20, 100), (150, -40)]:
+        check_composite('RGB', xy)
+
+
+def test_paste_product_cutout():
+    """Cut-out products are blended by their alpha, not pasted opaque."""
+    product = make_overlay()
+    canvas = make_canvas('RGB')
+    expected = reference_composite(canvas, product, (10, 20))
+
+    make_layout()._paste_product(canvas, product, (10, 20))
+
+    assert max_difference(canvas, expected) <= 1
+
+
+def main():
+    """Run all checks"""
+    print("="*60)
+    print("🧪 COMPOSITING REGRESSION TEST")
+    print("="*60)
+
+    tests = [
+        test_composite_rgb_canvas,
+        test_composite_rgba_canvas,
+        test_composite_clipped,
+        test_paste_product_cutout,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__doc__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__doc__} {e}")
+
+    print("\n" + "="*60)
+    print("🎉 ALL TESTS PASSED!" if not failed else f"❌ {failed} TEST(S) FAILED")
+    return failed
+
+
+if __name__ == '__main__':
+    raise SystemExit(1 if main() else 0)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Carousel Rendering Regression Test
+
+Checks that CarouselLayoutEngine.render_carousel (slides rendered on a thread
+pool) returns the same images as rendering each slide serially with
+render(), in the order the slides were given.
+
+Only layout styles that need no network access are used, so the test runs
+offline.
+
+Usage:
+    python test_render_carousel.py
+"""
+
+from PIL import ImageChops
+
+from src.layouts.yuan_payment_carousel import YuanPaymentCarouselLayout
+
+TITLES = [
+    "پرداخت یوان سریع و مطمئن",
+    "Fast **Yuan** payments",
+    "خرید از چین بدون دردسر",
+    "Step 4: *confirm* the transfer",
+    "پشتیبانی ۲۴ ساعته",
+    "Done!",
+]
+
+
+def make_slides():
+    """Build a carousel config whose slides all render differently."""
+    total = len(TITLES)
+    return [
+        {
+            'content': {'title': title, 'hero_text': f"{index + 1}/{total}"},
+            'background': {'mode': 'solid_color', 'color': [194, 0, 0]},
+            'options': {
+                'layout_style': 'centered_portrait' if index % 2 == 0 else 'symbol_focus',
+                'hero_mode': 'text',
+                'show_logo': False,
+                'slide_number': index + 1,
+                'total_slides': total,
+            },
+        }
+        for index, title in enumerate(TITLES)
+    ]
+
+
+def render_serially(slides):
+    """Render each slide with render(), one after another."""
+    images = []
+    for slide in slides:
+        layout = YuanPaymentCarouselLayout(
+            slide.get('content', {}),
+            slide.get('assets', {}),
+            slide.get('background', {}),
+            slide.get('options', {})
+        )
+        images.extend(layout.render())
+    return images
+
+
+def images_equal(a, b):
+    """True if two images have the same mode, size and pixels."""
+    return (a.mode == b.mode and a.size == b.size
+            and ImageChops.difference(a, b).getbbox() is None)
+
+
+def test_render_carousel_matches_serial_render():
+    """render_carousel matches serial render() output, in input order."""
+    slides = make_slides()
+    expected = render_serially(slides)
+    actual = YuanPaymentCarouselLayout.render_carousel(slides)
+
+    assert len(actual) == len(expected) == len(slides)
+    for index, (got, want) in enumerate(zip(actual, expected)):
+        assert images_equal(got, want), f"slide {index + 1} differs from serial render"
+
+    # Slides must be distinguishable, or the order check proves nothing
+    for index in range(len(expected) - 1):
+        assert not images_equal(expected[index], expected[index + 1])
+
+
+def test_render_carousel_empty():
+    """An empty carousel renders no slides."""
+    assert YuanPaymentCarouselLayout.render_carousel([]) == []
+
+
+def main():
+    """Run all checks"""
+    print("="*60)
+    print("🧪 CAROUSEL RENDERING REGRESSION TEST")
+    print("="*60)
+
+    tests = [
+        test_render_carousel_matches_serial_render,
+        test_render_carousel_empty,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__doc__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__doc__} {e}")
+
+    print("\n" + "="*60)
+    print("🎉 ALL TESTS PASSED!" if not failed else f"❌ {failed} TEST(S) FAILED")
+    return failed
+
+
+if __name__ == '__main__':
+    raise SystemExit(1 if main() else 0)
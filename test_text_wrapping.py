@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Text Wrapping Regression Test
+
+Checks that:
+1. LayoutEngine._wrap_text_fast (break points from cached character advances)
+   wraps exactly like the reference LayoutEngine._wrap_text, over a corpus of
+   English, Farsi and mixed text, several fonts and several widths
+2. LayoutEngine._shape_and_wrap wraps RTL text before shaping it, so
+   multi-line Farsi keeps its reading order (first words on the first line)
+3. Memoized _shape_and_wrap results are stable and safe to modify
+
+Usage:
+    python test_text_wrapping.py
+"""
+
+import os
+
+from PIL import ImageFont
+
+from src.layouts.headline_promo import HeadlinePromoLayout
+
+FONT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets', 'fonts')
+
+FONT_FILES = [
+    'NotoSans-Regular.ttf',
+    'NotoSans-Bold.ttf',
+    'IRANYekanRegularFaNum.ttf',
+    'IRANYekanBoldFaNum.ttf',
+]
+
+CORPUS = [
+    "Summer Sale",
+    "Up to 50% off everything in store this weekend only",
+    "The quick brown fox jumps over the lazy dog while WWWWW and iiiii wait",
+    "Supercalifragilisticexpialidocious is far too long for a single narrow line",
+    "AV To Ty We Yo kerning pairs: AVAVAV ToTo WAVE Tyrant",
+    "  leading   and trailing   whitespace   collapses  ",
+    "پرداخت یوان سریع و مطمئن برای خرید از چین و تجارت بین‌المللی",
+    "خرید آسان با پرداخت امن و پشتیبانی ۲۴ ساعته در تمام روزهای هفته",
+    "Yuan پرداخت 2024 با WeChat و Alipay برای import کالا",
+    "",
+]
+
+# Pure Farsi text long enough to wrap at the widths used below
+RTL_CORPUS = CORPUS[6:8]
+
+WIDTHS = [60, 150, 300, 500, 900]
+
+
+def make_layout():
+    """Create a layout instance to call the wrapping helpers on."""
+    return HeadlinePromoLayout({'headline': 'Test'})
+
+
+def load_fonts():
+    """Load every corpus font at two sizes, plus Pillow's default font."""
+    fonts = [ImageFont.load_default()]
+    for filename in FONT_FILES:
+        for size in (32, 58):
+            fonts.append(ImageFont.truetype(os.path.join(FONT_DIR, filename), size))
+    return fonts
+
+
+def test_wrap_text_fast_matches_wrap_text():
+    """_wrap_text_fast gives the same lines as _wrap_text."""
+    layout = make_layout()
+    for font in load_fonts():
+        for text in CORPUS:
+            for width in WIDTHS:
+                expected = layout._wrap_text(text, font, width)
+                actual = layout._wrap_text_fast(text, font, width)
+                assert actual == expected, (
+                    f"{getattr(font, 'path', 'default')} width {width}: "
+                    f"{actual!r} != {expected!r}"
+                )
+
+
+def test_shape_and_wrap_keeps_rtl_line_order():
+    """Multi-line RTL text is wrapped in logical order, then shaped per line."""
+    layout = make_layout()
+    font = ImageFont.truetype(os.path.join(FONT_DIR, 'IRANYekanRegularFaNum.ttf'), 58)
+    for text in RTL_CORPUS:
+        for width in (300, 500):
+            logical_lines = layout._wrap_text(text, font, width)
+            assert len(logical_lines) > 1, f"{text!r} fits on one line at {width}"
+
+            lines = layout._shape_and_wrap(text, font, width, True)
+            assert lines == [layout._prepare_arabic_text(line) for line in logical_lines]
+
+            # The first words of the text belong on the first line
+            first_word = layout._prepare_arabic_text(text.split()[0])
+            last_word = layout._prepare_arabic_text(text.split()[-1])
+            assert first_word in lines[0], f"first word not on first line: {lines!r}"
+            assert last_word in lines[-1], f"last word not on last line: {lines!r}"
+
+
+def test_shape_and_wrap_memo():
+    """Repeated _shape_and_wrap calls return equal, independent lists."""
+    layout = make_layout()
+    font = ImageFont.truetype(os.path.join(FONT_DIR, 'IRANYekanRegularFaNum.ttf'), 58)
+    text = RTL_CORPUS[0]
+
+    first = layout._shape_and_wrap(text, font, 300, True)
+    first.append('modified')
+    second = layout._shape_and_wrap(text, font, 300, True)
+
+    assert second == first[:-1]
+    assert second == layout._shape_and_wrap(text, font, 300, True)
+
+
+def main():
+    """Run all checks"""
+    print("="*60)
+    print("🧪 TEXT WRAPPING REGRESSION TEST")
+    print("="*60)
+
+    tests = [
+        test_wrap_text_fast_matches_wrap_text,
+        test_shape_and_wrap_keeps_rtl_line_order,
+        test_shape_and_wrap_memo,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__doc__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__doc__} {e}")
+
+    print("\n" + "="*60)
+    print("🎉 ALL TESTS PASSED!" if not failed else f"❌ {failed} TEST(S) FAILED")
+    return failed
+
+
+if __name__ == '__main__':
+    raise SystemExit(1 if main() else 0)